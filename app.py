@@ -1,24 +1,47 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import praw
+import prawcore
 import requests
+import asyncio
 import logging
-import time
+import multiprocessing
 import json
+import importlib
+import sys
 import os
+import hashlib
+import heapq
+import itertools
+import queue
+import random
+import socket
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Dict, Set
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, urljoin
 from bs4 import BeautifulSoup
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.summarizers.lsa import LsaSummarizer
-from sumy.nlp.stemmers import Stemmer
-from sumy.utils import get_stop_words
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from readability.readability import Document
-import newspaper
-import cloudscraper
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import subreddits
+import blacklist
+
+# Heavy extraction and summarization dependencies (selenium, newspaper,
+# readability, cloudscraper, sumy) are imported on first use through
+# lazy_import() so the bot starts without paying for ones it never needs.
+LAZY_MODULES = [
+    'cloudscraper', 'newspaper', 'readability.readability',
+    'selenium.webdriver', 'selenium.webdriver.chrome.options',
+    'selenium.webdriver.support.ui', 'selenium.common.exceptions',
+    'sumy.nlp.stemmers', 'sumy.utils', 'numpy', 'scipy.sparse', 'lxml.etree'
+]
 
 # Logging setup
 logging.basicConfig(level=logging.INFO,
@@ -31,6 +54,66 @@ logging.basicConfig(level=logging.INFO,
                     ])
 logger = logging.getLogger(__name__)
 
+EAGER_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
+def lazy_import(module_name: str):
+    """Import a heavy dependency on first use and log how long it took."""
+    if module_name in sys.modules:
+        # import_module still waits if another thread is mid-import.
+        return importlib.import_module(module_name)
+
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed = time.perf_counter() - started
+    logger.info(f"Imported {module_name} in {elapsed * 1000:.0f} ms")
+    return module
+
+
+def _standalone_import_seconds(module_name: str) -> float:
+    """Time importing a module in a fresh interpreter.
+
+    In this process the eager imports (lxml, bs4, requests, praw) and
+    earlier lazy imports have already loaded shared dependencies, so a
+    module like lxml.etree or selenium.common.exceptions would look free.
+    """
+    import subprocess
+
+    script = ("import time; started = time.perf_counter(); "
+              f"import {module_name}; "
+              "print(time.perf_counter() - started)")
+    result = subprocess.run([sys.executable, '-c', script],
+                            capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines() or ["unknown error"]
+        raise ImportError(error[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def report_import_profile():
+    """Log eager and deferred import timings so startup regressions show.
+
+    Each deferred module is timed on its own in a fresh interpreter, so
+    the figures include the dependencies it would pull in and overlap
+    where modules share them (numpy under scipy.sparse, for example).
+    """
+    timings = {}
+    for module_name in LAZY_MODULES:
+        try:
+            timings[module_name] = _standalone_import_seconds(module_name)
+        except Exception as e:
+            logger.warning(f"Could not import {module_name}: {e}")
+
+    logger.info("Import profile:")
+    logger.info(
+        f"  {'eager imports (app startup)':<36} {EAGER_IMPORT_SECONDS * 1000:8.1f} ms"
+    )
+    for module_name, seconds in timings.items():
+        logger.info(f"  {module_name:<36} {seconds * 1000:8.1f} ms")
+    logger.info(
+        f"  {'total deferred (overlapping)':<36} {sum(timings.values()) * 1000:8.1f} ms"
+    )
+
 
 class Config:
     # Reddit OAuth credentials (use refresh token for persistent authentication)
@@ -39,15 +122,180 @@ class Config:
     REDDIT_USER_AGENT = "AfricaVoiceBot/1.0 by u/Old-Star54"
     REDDIT_REFRESH_TOKEN = "143460106421528-Ei3SO1wR3aBlnjRi2cjCmlbgc0Y-rg"
     SUBREDDIT_NAME = "AfricaVoice"
-    COMMENT_DELAY = 720  # 12 minutes between comments
-    SUBMISSION_DELAY = 90  # 90 seconds between submission checks (reduced from 5 minutes)
+    SUBREDDITS = list(subreddits.subreddits) or [SUBREDDIT_NAME]  # Watched together
+    # Per-subreddit overrides, e.g.
+    # {"AfricaVoice": {"max_post_age_minutes": 10, "sentences_count": 3,
+    #                  "blocked_domains": ["example.com"]}}
+    SUBREDDIT_SETTINGS: Dict[str, Dict[str, any]] = {}
+    # Links never worth extracting, on top of blacklist.blocked. Subdomains match too.
+    EXCLUDED_DOMAINS = ["reddit.com", "redd.it"]
+    MEDIA_DOMAINS = [
+        "gfycat.com", "giphy.com", "imgur.com", "instagram.com", "tiktok.com",
+        "twitch.tv", "vimeo.com", "youtu.be", "youtube.com"
+    ]
+    MEDIA_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".gifv", ".webp",
+                        ".mp4", ".webm", ".mov", ".mp3")
+    # Token buckets per Reddit action: (burst capacity, seconds per token).
+    # Reddit's own RATELIMIT errors and X-Ratelimit headers still apply on top.
+    RATE_LIMITS = {
+        "comment": (2, 60.0),
+        "delete": (10, 2.0),
+        "fetch": (30, 1.0),
+    }
+    RATELIMIT_MAX_RETRIES = 3  # Retries after a RATELIMIT API error
+    INTAKE_MIN_DELAY = 2  # Poll this often while new posts keep arriving
+    INTAKE_MAX_DELAY = 6  # Quiet back-off cap; before= polls are one cheap request
+    INTAKE_CURSOR_FILE = "intake_cursor.json"  # Last seen submission, for restarts
+    INTAKE_PAGE_SIZE = 100  # Listing page size (Reddit's maximum)
+    INTAKE_RESYNC_POLLS = 20  # Empty polls before re-checking the cursor
     MONITORING_PING_DELAY = 90  # 90 seconds for monitoring ping when no new posts
     MAX_POST_AGE_MINUTES = 5  # Only process posts less than 5 minutes old
+    PROCESSING_WORKERS = 2  # Extraction/summarization workers
+    PROCESSING_WORKER_MODE = "thread"  # "thread", or "process" to summarize in worker processes
+    WORK_QUEUE_SIZE = 20  # Submissions waiting for a worker
+    WORK_QUEUE_ORDER = "expiry"  # "expiry" (closest to the age cutoff) or "newest"
+    ASYNC_PROCESS_WORKERS = 3  # Concurrent extraction/summarization tasks (--async)
+    ASYNC_QUEUE_SIZE = 50  # Submissions waiting between pipeline stages (--async)
     LANGUAGE = "english"
     SENTENCES_COUNT = 4
+    SUMMARIZER_BACKEND = "heuristic"  # heuristic, lsa, textrank or lexrank
+    SUMMARIZER_MAX_SENTENCES = 300  # Sentences scored by the matrix backends
     DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/1379376565699219486/S4rbFt_5m4aYtNdCJgRZeleIASCK_1WV8RonVpUvjdv9gwF7k_3viqkSV5oSDJw917lC"
-    COMMENT_HISTORY_FILE = "comment_history.json"
+    COMMENT_HISTORY_FILE = "comment_history.db"
+    COMMENT_HISTORY_LEGACY_FILE = "comment_history.json"  # Imported once if present
+    COMMENT_HISTORY_MAX_ENTRIES = 5000  # Oldest entries are evicted beyond this
+    RELATED_NEWS_TIMEOUT = 10  # Seconds per Google News RSS request
+    RELATED_NEWS_CACHE_TTL = 600  # Seconds an RSS result is reused
+    RELATED_NEWS_CACHE_SIZE = 256  # RSS results kept in memory
+    POSTED_INDEX_SCAN_LIMIT = 1000  # Own comments scanned at startup (Reddit's listing cap)
+    INTENT_RESCAN_ATTEMPTS = 2  # Retries of a failed startup scan before reconciling intents
+    INTENT_RESCAN_DELAY = 10  # Seconds between those retries
+    DUPLICATE_CHECK_DELAYS = [30, 60, 120, 300, 600, 1200]  # Seconds after posting
+    DUPLICATE_SCAN_LIMIT = 100  # Own comments scanned per duplicate check (one request)
+    DOMAIN_STATS_FILE = "domain_stats.json"
+    STRATEGY_MIN_ATTEMPTS = 5  # Attempts before a strategy can be skipped
+    STRATEGY_SKIP_SUCCESS_RATE = 0.1  # Skip strategies that succeed less often
+    STRATEGY_EXPLORE_RATE = 0.1  # Chance of retrying a skipped strategy
+    ARTICLE_CACHE_DIR = "article_cache"
+    ARTICLE_CACHE_TTL = 24 * 3600  # Seconds an extracted article stays valid
+    ARTICLE_CACHE_MAX_BYTES = 50 * 1024 * 1024  # Evict LRU entries beyond this
     MIN_CONTENT_LENGTH = 50
+    FILTER_RULES_FILE = "filter_rules.json"  # Optional extra summary filter rules
+    BROWSER_POOL_SIZE = 1  # Warm headless Chrome instances kept for Selenium
+    BROWSER_MAX_PAGES = 50  # Recycle a browser after this many pages
+    BROWSER_MAX_RSS_MB = 1024  # Recycle a browser above this resident memory
+    BROWSER_PAGE_TIMEOUT = 15  # Seconds to wait for a page to become ready
+    BROWSER_ACQUIRE_TIMEOUT = 60  # Seconds to wait for a free browser
+    SHUTDOWN_JOIN_TIMEOUT = 30  # Seconds close() waits for the comment poster
+    PREFLIGHT_ENABLED = True  # Check Content-Type/Length before extracting
+    PREFLIGHT_TIMEOUT = 5  # Seconds for the pre-flight request
+    PREFLIGHT_CACHE_TTL = 3600  # Seconds a pre-flight result is reused
+    HTTP_POOL_CONNECTIONS = 20  # Hosts with their own keep-alive pool
+    HTTP_POOL_MAXSIZE = 10  # Connections kept alive per host
+    HTTP_RETRIES = 3  # Retries on connection errors and retryable statuses
+    HTTP_BACKOFF = 0.5  # Exponential backoff factor between retries
+    HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+    DNS_CACHE_TTL = 0  # Seconds to reuse resolved host names; 0 disables
+    MAX_PAGE_BYTES = 3 * 1024 * 1024  # Pages larger than this are not parsed
+    FETCH_CHUNK_BYTES = 64 * 1024  # Bytes read from the socket at a time
+    FETCH_ENOUGH_TEXT = 40000  # Stop downloading after this much <p> text
+    SELECTOR_MODE = "priority"  # priority (first matching selector) or density
+    SELECTOR_MAX_LINK_DENSITY = 0.5  # Density mode ignores blocks that are mostly links
+
+
+class HttpClient:
+    """The process-wide HTTP layer every outbound call goes through.
+
+    One requests.Session whose adapters keep per-host keep-alive pools and
+    retry idempotent requests with exponential backoff. Other sessions (the
+    cloudscraper one) get adapters with the same settings from adapter().
+    If DNS_CACHE_TTL is set, host name lookups are cached for that long;
+    this wraps socket.getaddrinfo, so it applies to the whole process.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.configure(self.session)
+        if Config.DNS_CACHE_TTL > 0:
+            self._install_dns_cache(Config.DNS_CACHE_TTL)
+
+    @classmethod
+    def shared(cls) -> 'HttpClient':
+        """The client for this process, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def adapter(self, retry_statuses: tuple = Config.HTTP_RETRY_STATUSES,
+                adapter_class: type = HTTPAdapter, **kwargs) -> HTTPAdapter:
+        """A new adapter with the client's pool sizes and retry policy.
+
+        adapter_class and kwargs allow HTTPAdapter subclasses such as
+        cloudscraper's TLS cipher adapter.
+        """
+        retry = Retry(total=Config.HTTP_RETRIES,
+                      backoff_factor=Config.HTTP_BACKOFF,
+                      status_forcelist=retry_statuses,
+                      allowed_methods=frozenset({'GET', 'HEAD'}),
+                      respect_retry_after_header=True,
+                      raise_on_status=False)
+        return adapter_class(pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                             pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                             max_retries=retry,
+                             **kwargs)
+
+    def configure(self, session: requests.Session,
+                  retry_statuses: tuple = Config.HTTP_RETRY_STATUSES):
+        """Mount pooled, retrying adapters for http:// and https://."""
+        for prefix in ('http://', 'https://'):
+            self.mount(session, prefix, self.adapter(retry_statuses))
+
+    @staticmethod
+    def mount(session: requests.Session, prefix: str, adapter: HTTPAdapter):
+        """Mount an adapter on a session, closing the one it replaces."""
+        replaced = session.adapters.get(prefix)
+        session.mount(prefix, adapter)
+        if replaced is not None and replaced is not adapter:
+            replaced.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.session.post(url, **kwargs)
+
+    @staticmethod
+    def _install_dns_cache(ttl: float):
+        """Wrap socket.getaddrinfo with a TTL cache, once per process."""
+        if getattr(socket.getaddrinfo, 'cached', False):
+            return
+
+        resolve = socket.getaddrinfo
+        cache: Dict[tuple, tuple] = {}
+        lock = threading.Lock()
+
+        def cached_getaddrinfo(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.time()
+            with lock:
+                entry = cache.get(key)
+            if entry and now - entry[0] < ttl:
+                return entry[1]
+
+            result = resolve(*args, **kwargs)
+            with lock:
+                if len(cache) > 1024:
+                    for stale in [k for k, v in cache.items() if now - v[0] >= ttl]:
+                        del cache[stale]
+                cache[key] = (now, result)
+            return result
+
+        cached_getaddrinfo.cached = True
+        socket.getaddrinfo = cached_getaddrinfo
 
 
 class DiscordNotifier:
@@ -71,9 +319,9 @@ class DiscordNotifier:
 
             payload = {"embeds": [embed]}
 
-            response = requests.post(self.webhook_url,
-                                     json=payload,
-                                     timeout=10)
+            response = HttpClient.shared().post(self.webhook_url,
+                                                json=payload,
+                                                timeout=10)
             if response.status_code == 204:
                 logger.info("Discord notification sent successfully")
             else:
@@ -83,36 +331,1063 @@ class DiscordNotifier:
             logger.error(f"Failed to send Discord notification: {e}")
 
 
-class ContentExtractor:
+class FetchedPage:
+    """A downloaded page shared by all HTTP-based extraction strategies.
+
+    tree is the lxml document parsed while the page streamed in, or None
+    if incremental parsing failed.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str],
+                 content: bytes, encoding: str, text: Optional[str] = None,
+                 tree=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.tree = tree
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """Page body decoded once and reused by every parser."""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding, errors='replace')
+        return self._text
+
+
+class PreflightResult:
+    """What a link points to, learned from response headers alone."""
+
+    HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+    def __init__(self, url: str, content_type: str = "",
+                 content_length: Optional[int] = None):
+        self.url = url
+        self.content_type = content_type
+        self.content_length = content_length
+        self.checked_at = time.time()
+
+    @property
+    def rejection(self) -> Optional[str]:
+        """Why the target should not be extracted, or None."""
+        if self.content_type and self.content_type not in self.HTML_TYPES:
+            return f"non-HTML content ({self.content_type})"
+        if self.content_length and self.content_length > Config.MAX_PAGE_BYTES:
+            return f"oversized page ({self.content_length} bytes)"
+        return None
+
+
+class PooledBrowser:
+    """A Chrome driver checked out of the BrowserPool."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class BrowserPool:
+    """Keeps warm headless Chrome instances for Selenium extraction.
+
+    Browsers are launched on first use and handed back after each page with
+    their single tab reset to about:blank. A browser is recycled once it
+    has served max_pages pages or its process tree exceeds max_rss_mb.
+    """
+
+    def __init__(self, size: int, max_pages: int, max_rss_mb: int):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle: list = []
+        # Notified whenever a browser is returned or retired, so waiters
+        # re-check for an idle browser or a free launch slot.
+        self._available = threading.Condition()
+        self._browsers: Set[PooledBrowser] = set()
+        self._launching = 0
+        self._closed = False
+
+    @contextmanager
+    def browser(self):
+        """Check out a driver for the duration of a with block."""
+        browser = self._acquire()
+        try:
+            yield browser.driver
+        except Exception:
+            # A driver that raised may be wedged; don't hand it out again.
+            self._retire(browser)
+            raise
+        else:
+            self._release(browser)
+
+    def shutdown(self):
+        """Quit every browser, including ones currently checked out."""
+        with self._available:
+            self._closed = True
+            browsers = list(self._browsers)
+            self._browsers.clear()
+            self._idle.clear()
+            self._available.notify_all()
+        for browser in browsers:
+            self._quit(browser)
+        if browsers:
+            logger.info(f"Shut down {len(browsers)} pooled browser(s)")
+
+    def _acquire(self) -> PooledBrowser:
+        deadline = time.monotonic() + Config.BROWSER_ACQUIRE_TIMEOUT
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is shut down")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._browsers) + self._launching < self.size:
+                    self._launching += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a pooled browser")
+                self._available.wait(remaining)
+
+        try:
+            browser = PooledBrowser(self._launch())
+        except Exception:
+            with self._available:
+                self._launching -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._launching -= 1
+            self._browsers.add(browser)
+        return browser
+
+    def _release(self, browser: PooledBrowser):
+        browser.pages += 1
+
+        if self._closed or browser.pages >= self.max_pages:
+            self._retire(browser)
+            return
+
+        rss_mb = self._browser_rss_mb(browser.driver)
+        if rss_mb > self.max_rss_mb:
+            logger.info(
+                f"Recycling browser using {rss_mb:.0f} MB after {browser.pages} pages"
+            )
+            self._retire(browser)
+            return
+
+        try:
+            # Close any popups the page opened and blank the main tab so the
+            # next page starts from a clean document.
+            handles = browser.driver.window_handles
+            for handle in handles[1:]:
+                browser.driver.switch_to.window(handle)
+                browser.driver.close()
+            browser.driver.switch_to.window(handles[0])
+            browser.driver.get("about:blank")
+        except Exception as e:
+            logger.debug(f"Error resetting browser tab: {e}")
+            self._retire(browser)
+            return
+
+        with self._available:
+            if not self._closed:
+                self._idle.append(browser)
+                self._available.notify()
+                return
+        self._quit(browser)
+
+    def _retire(self, browser: PooledBrowser):
+        with self._available:
+            self._browsers.discard(browser)
+            self._available.notify()
+        self._quit(browser)
+
+    def _quit(self, browser: PooledBrowser):
+        try:
+            browser.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error closing driver: {e}")
+
+    def _launch(self):
+        """Start a new headless Chrome instance."""
+        logger.info("Launching pooled headless browser")
+        webdriver = lazy_import('selenium.webdriver')
+        Options = lazy_import('selenium.webdriver.chrome.options').Options
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(
+            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        )
+        # Return from get() at DOMContentLoaded instead of waiting for every
+        # image and ad; readiness is checked explicitly afterwards.
+        chrome_options.page_load_strategy = "eager"
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(Config.BROWSER_PAGE_TIMEOUT)
+        return driver
+
+    def _browser_rss_mb(self, driver) -> float:
+        """Resident memory of chromedriver and every process it spawned."""
+        try:
+            root_pid = driver.service.process.pid
+            children: Dict[int, list] = {}
+            for entry in os.listdir('/proc'):
+                if not entry.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry}/stat') as f:
+                        ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+                except (OSError, IndexError, ValueError):
+                    continue
+                children.setdefault(ppid, []).append(int(entry))
+
+            total_kb = 0
+            pending = [root_pid]
+            while pending:
+                pid = pending.pop()
+                pending.extend(children.get(pid, []))
+                try:
+                    with open(f'/proc/{pid}/status') as f:
+                        for line in f:
+                            if line.startswith('VmRSS:'):
+                                total_kb += int(line.split()[1])
+                                break
+                except OSError:
+                    continue
+            return total_kb / 1024
+        except Exception as e:
+            # No /proc (non-Linux) or no service process; skip the check.
+            logger.debug(f"Could not measure browser memory: {e}")
+            return 0.0
+
+
+class DomainStrategyStats:
+    """Per-domain success rate and latency of each extraction strategy.
+
+    Used to try the strategies that work for a site first and to skip the
+    ones that keep failing there. Skipped strategies are still retried with
+    probability STRATEGY_EXPLORE_RATE so a site that changes gets noticed.
+    """
+
+    SAVE_EVERY = 10  # Persist after this many recorded attempts
+    MAX_ATTEMPTS = 50  # Halve the counts beyond this so old results fade
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._lock = threading.Lock()
+        # Serializes writers of the shared .tmp file; taken before _lock so
+        # snapshots reach disk in the order they were taken.
+        self._save_lock = threading.Lock()
+        self._unsaved = 0
+        self.stats: Dict[str, Dict[str, Dict[str, float]]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Load strategy stats from file."""
+        try:
+            if os.path.exists(self.filename):
+                with open(self.filename, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading domain strategy stats: {e}")
+        return {}
+
+    def save(self):
+        """Save strategy stats to file atomically."""
+        with self._save_lock:
+            with self._lock:
+                data = json.dumps(self.stats)
+                self._unsaved = 0
+            try:
+                tmp_filename = f"{self.filename}.tmp"
+                with open(tmp_filename, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_filename, self.filename)
+            except Exception as e:
+                logger.error(f"Error saving domain strategy stats: {e}")
+
+    def record(self, domain: str, method: str, success: bool,
+               latency: float):
+        """Record the outcome of one strategy attempt."""
+        with self._lock:
+            entry = self.stats.setdefault(domain, {}).setdefault(
+                method, {
+                    'attempts': 0,
+                    'successes': 0,
+                    'avg_latency': latency
+                })
+            entry['attempts'] += 1
+            entry['successes'] += int(success)
+            entry['avg_latency'] += 0.2 * (latency - entry['avg_latency'])
+            if entry['attempts'] > self.MAX_ATTEMPTS:
+                entry['attempts'] /= 2
+                entry['successes'] /= 2
+            self._unsaved += 1
+            should_save = self._unsaved >= self.SAVE_EVERY
+
+        if should_save:
+            self.save()
+
+    def plan(self, domain: str, methods: list) -> list:
+        """Order methods best-first for a domain, dropping hopeless ones.
+
+        Methods without history keep their default position. If every
+        method would be skipped, all of them are returned instead.
+        """
+        with self._lock:
+            domain_stats = dict(self.stats.get(domain, {}))
+
+        def success_rate(method) -> float:
+            entry = domain_stats.get(method.__name__)
+            if not entry:
+                return 0.5
+            # Smoothed so one early failure doesn't sink a method.
+            return (entry['successes'] + 1) / (entry['attempts'] + 2)
+
+        def latency(method) -> float:
+            entry = domain_stats.get(method.__name__)
+            return entry['avg_latency'] if entry else 0.0
+
+        def is_hopeless(method) -> bool:
+            entry = domain_stats.get(method.__name__)
+            if not entry or entry['attempts'] < Config.STRATEGY_MIN_ATTEMPTS:
+                return False
+            rate = entry['successes'] / entry['attempts']
+            return rate < Config.STRATEGY_SKIP_SUCCESS_RATE
+
+        ordered = sorted(methods,
+                         key=lambda m: (-success_rate(m), latency(m)))
+        planned = [
+            method for method in ordered if not is_hopeless(method)
+            or random.random() < Config.STRATEGY_EXPLORE_RATE
+        ]
+        if len(planned) < len(ordered):
+            skipped = [m.__name__ for m in ordered if m not in planned]
+            logger.info(f"Skipping {', '.join(skipped)} for {domain}")
+        return planned or ordered
+
+
+class ArticleCache:
+    """On-disk cache of extracted articles and summaries.
+
+    Entries are keyed by a normalized canonical URL so cross-posts and
+    reposts of the same article hit the cache. When a page declares a
+    different <link rel=canonical>, the submitted URL is stored as an alias
+    of the canonical one. Entries expire after ttl seconds and the least
+    recently used ones are evicted once the cache exceeds max_bytes.
+    """
+
+    TRACKING_PARAMS = {
+        'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+        'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'smid', 'smtyp',
+        'guccounter', 'guce_referrer', 'guce_referrer_sig', 'ito', 'at_medium',
+        'at_campaign', 'CMP', '_ga', 'share', 'taid', 'xtor'
+    }
+
+    def __init__(self, directory: str, ttl: int, max_bytes: int):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> file size, ordered least recently used first
+        self._index: OrderedDict = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    def normalize_url(self, url: str) -> str:
+        """Normalize a URL by dropping tracking params, fragments and noise."""
+        try:
+            parsed = urlparse(url.strip())
+            host = (parsed.hostname or '').lower()
+            if host.startswith('www.'):
+                host = host[4:]
+            if parsed.port and parsed.port not in (80, 443):
+                host = f"{host}:{parsed.port}"
+
+            query = sorted(
+                (key, value)
+                for key, value in parse_qsl(parsed.query,
+                                            keep_blank_values=True)
+                if not key.lower().startswith('utm_')
+                and key not in self.TRACKING_PARAMS)
+
+            path = parsed.path or '/'
+            if len(path) > 1:
+                path = path.rstrip('/')
+
+            # http and https copies of an article are the same article.
+            return urlunparse(('https', host, path, '', urlencode(query), ''))
+        except Exception:
+            return url
+
+    def get(self, url: str, field: str):
+        """Return a cached field for the URL, or None on a miss."""
+        with self._lock:
+            entry = self._read_entry(self._key(url))
+            if entry and 'alias' in entry:
+                entry = self._read_entry(entry['alias'])
+            if not entry:
+                return None
+            return entry['fields'].get(field)
+
+    def put(self, url: str, field: str, value):
+        """Store a field for the URL, keeping its other fields."""
+        key = self._key(url)
+        with self._lock:
+            entry = self._read_entry(key)
+            if entry and 'alias' in entry:
+                key = entry['alias']
+                entry = self._read_entry(key)
+            if not entry:
+                entry = {
+                    'url': self.normalize_url(url),
+                    'created': time.time(),
+                    'fields': {}
+                }
+            entry['fields'][field] = value
+            self._write_entry(key, entry)
+            self._evict()
+
+    def add_alias(self, url: str, canonical_url: str):
+        """Point url at the entry for canonical_url."""
+        key = self._key(url)
+        target = self._key(canonical_url)
+        if key == target:
+            return
+        with self._lock:
+            self._write_entry(key, {
+                'url': self.normalize_url(url),
+                'created': time.time(),
+                'alias': target
+            })
+            self._evict()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(self.normalize_url(url).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load_index(self):
+        """Rebuild the LRU index from file modification times."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith('.json'):
+                    continue
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, name[:-5], stat.st_size))
+            for _, key, size in sorted(entries):
+                self._index[key] = size
+                self._total_bytes += size
+            logger.info(
+                f"Article cache loaded: {len(self._index)} entries, {self._total_bytes} bytes"
+            )
+        except Exception as e:
+            logger.error(f"Error loading article cache: {e}")
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, any]]:
+        path = self._path(key)
+        if key not in self._index:
+            # Written by another bot sharing the directory since we loaded
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                return None
+            self._index[key] = size
+            self._total_bytes += size
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except Exception as e:
+            logger.debug(f"Dropping unreadable cache entry {key}: {e}")
+            self._remove(key)
+            return None
+
+        if time.time() - entry.get('created', 0) > self.ttl:
+            self._remove(key)
+            return None
+
+        # Touch the file so recency survives restarts.
+        self._index.move_to_end(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _write_entry(self, key: str, entry: Dict[str, any]):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except Exception as e:
+            logger.error(f"Error writing article cache entry: {e}")
+            return
+        self._total_bytes += size - self._index.pop(key, 0)
+        self._index[key] = size
+
+    def _remove(self, key: str):
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Drop least recently used entries until under the size limit."""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            oldest_key = next(iter(self._index))
+            self._remove(oldest_key)
+
+
+class TextBlock:
+    """Text gathered for one element during a SelectorEngine walk."""
+
+    __slots__ = ('pieces', 'link_chars')
 
     def __init__(self):
-        self.scraper = cloudscraper.create_scraper()
+        self.pieces = []
+        self.link_chars = 0
+
+    @property
+    def text(self) -> str:
+        """Same as BeautifulSoup's get_text(separator=' ').strip()."""
+        return ' '.join(self.pieces).strip()
+
+    @property
+    def link_density(self) -> float:
+        text_chars = sum(len(piece) for piece in self.pieces)
+        return self.link_chars / text_chars if text_chars else 1.0
+
+
+class SelectorEngine:
+    """Finds the article text in an lxml tree with a single walk.
+
+    The CSS selectors are compiled once into element predicates. One pass
+    over the tree collects the text of every matching element and every
+    <p>, plus how much of it sits inside links. Text inside script, style,
+    template and comments is skipped, as BeautifulSoup's get_text does.
+
+    Output matches the old BeautifulSoup/html.parser path (see
+    tests/test_selector_engine.py) except where libxml2 builds a different
+    tree: CDATA is dropped, a block or nested <a> inside an inline element
+    closes it, and an unclosed <p> is closed by the next <p> or <div>.
+    """
+
+    SELECTORS = [
+        'article', '[role="main"]', '.content', '.article-content',
+        '.post-content', '.entry-content', 'main', '#content', '.story-body',
+        'div[data-component="text-block"]'
+    ]
+    SKIPPED_TAGS = {'script', 'style', 'template'}
+
+    def __init__(self, selectors: Optional[list] = None):
+        self.selectors = selectors or self.SELECTORS
+        self._predicates = [self._compile(s) for s in self.selectors]
+
+    @staticmethod
+    def _compile(selector: str):
+        """Turn tag, .class, #id and tag[attr="value"] selectors into predicates."""
+        import re
+
+        match = re.fullmatch(
+            r'([\w-]*)(?:\.([\w-]+)|#([\w-]+)|\[([\w-]+)="([^"]*)"\])?',
+            selector)
+        if not match or not any(match.groups()):
+            raise ValueError(f"Unsupported selector: {selector}")
+        tag, class_name, element_id, attribute, value = match.groups()
+
+        def predicate(element) -> bool:
+            if tag and element.tag != tag:
+                return False
+            if class_name:
+                return class_name in element.get('class', '').split()
+            if element_id:
+                return element.get('id') == element_id
+            if attribute:
+                return element.get(attribute) == value
+            return True
+
+        return predicate
+
+    def scan(self, root):
+        """Walk the tree once; return per-selector matches and paragraphs."""
+        matches = [[] for _ in self._predicates]
+        paragraphs = []
+        open_blocks = []
+        skip_depth = 0
+        link_depth = 0
+
+        def emit(text):
+            if not text or skip_depth:
+                return
+            for block in open_blocks:
+                block.pieces.append(text)
+                if link_depth:
+                    block.link_chars += len(text)
+
+        def start(element):
+            nonlocal skip_depth, link_depth
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                skip_depth += 1
+                return
+            block = None
+            for i, predicate in enumerate(self._predicates):
+                if predicate(element):
+                    block = block or TextBlock()
+                    matches[i].append(block)
+            if tag == 'p':
+                block = block or TextBlock()
+                paragraphs.append(block)
+            if block:
+                open_blocks.append(block)
+            block_stack.append(block)
+
+            if tag in self.SKIPPED_TAGS:
+                skip_depth += 1
+            elif tag == 'a':
+                link_depth += 1
+            emit(element.text)
+
+        def end(element):
+            nonlocal skip_depth, link_depth
+            tag = element.tag
+            if not isinstance(tag, str):
+                skip_depth -= 1
+            else:
+                if block_stack.pop():
+                    open_blocks.pop()
+                if tag in self.SKIPPED_TAGS:
+                    skip_depth -= 1
+                elif tag == 'a':
+                    link_depth -= 1
+            emit(element.tail)
+
+        block_stack = []
+        start(root)
+        stack = [(root, iter(root))]
+        while stack:
+            element, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                end(element)
+                continue
+            start(child)
+            stack.append((child, iter(child)))
+
+        return matches, paragraphs
+
+    def extract(self, root, mode: str = Config.SELECTOR_MODE) -> str:
+        """Return the article text from a parsed document."""
+        if root is None:
+            return ""
+        matches, paragraphs = self.scan(root)
+
+        if mode == "density":
+            best, best_score = None, 0.0
+            seen = set()
+            for block in (b for blocks in matches for b in blocks):
+                if id(block) in seen:
+                    continue
+                seen.add(id(block))
+                content = block.text
+                if len(content.split()) < 30:
+                    continue
+                link_density = block.link_density
+                if link_density > Config.SELECTOR_MAX_LINK_DENSITY:
+                    continue
+                score = len(content) * (1 - link_density)
+                if score > best_score:
+                    best, best_score = content, score
+            if best:
+                return best
+        else:
+            # The first selector with enough text wins, in priority order
+            for blocks in matches:
+                if blocks:
+                    content = ' '.join(block.text for block in blocks)
+                    if len(content.split()) >= 30:
+                        return content
+
+        return ' '.join(block.text for block in paragraphs)
+
+
+class ContentExtractor:
+
+    REQUEST_HEADERS = {
+        "User-Agent":
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept":
+        "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+    }
+
+    def __init__(self, cache: Optional[ArticleCache] = None):
+        self.cache = cache
+        self._scraper = None
+        self._scraper_lock = threading.Lock()
+        self._preflights: Dict[str, PreflightResult] = {}
+        self._preflight_lock = threading.Lock()
+        self.browser_pool = BrowserPool(Config.BROWSER_POOL_SIZE,
+                                        Config.BROWSER_MAX_PAGES,
+                                        Config.BROWSER_MAX_RSS_MB)
+        self.strategy_stats = DomainStrategyStats(Config.DOMAIN_STATS_FILE)
+        self.selector_engine = SelectorEngine()
 
     def extract_content(self, url: str) -> Optional[Dict[str, any]]:
         """Extract content using multiple fallback methods."""
-        methods = [
+        if self.cache:
+            cached = self.cache.get(url, 'extracted')
+            if cached:
+                logger.info(f"Using cached extraction for {url}")
+                return cached
+
+        if Config.PREFLIGHT_ENABLED:
+            preflight = self._preflight(url)
+            if preflight.rejection:
+                logger.info(f"Skipping {url}: {preflight.rejection}")
+                return None
+            if self.cache and preflight.url != url:
+                # A redirect to an article we already have.
+                cached = self.cache.get(preflight.url, 'extracted')
+                if cached:
+                    logger.info(
+                        f"Using cached extraction for redirect target {preflight.url}")
+                    return cached
+
+        domain = self._get_domain(url)
+        methods = self.strategy_stats.plan(domain, [
             self._try_newspaper_extraction, self._try_selenium_extraction,
-            self._try_readability_extraction, self._try_basic_requests
+            self._try_readability_extraction, self._try_selector_extraction
+        ])
+        browser_methods = [
+            method for method in methods
+            if method == self._try_selenium_extraction
         ]
+        http_methods = [
+            method for method in methods if method not in browser_methods
+        ]
+
+        # Download the page once; only the browser path fetches it again.
+        page = self._fetch_page(url) if http_methods else None
+
+        canonical_url = self._find_canonical_url(page) if page else None
+        if self.cache and canonical_url:
+            # A different submitted URL for an article we already have.
+            self.cache.add_alias(url, canonical_url)
+            cached = self.cache.get(canonical_url, 'extracted')
+            if cached:
+                logger.info(
+                    f"Using cached extraction for canonical URL {canonical_url}")
+                return cached
+
+        result = self._run_strategies(browser_methods, http_methods, url,
+                                      page, domain)
+        if not result:
+            logger.warning(f"All extraction methods failed for URL: {url}")
+            return None
+
+        if self.cache:
+            result['canonical_url'] = self.cache.normalize_url(canonical_url
+                                                               or url)
+            self.cache.put(result['canonical_url'], 'extracted', result)
+            self.cache.add_alias(url, result['canonical_url'])
+        return result
+
+    def _run_strategies(self, browser_methods: list, http_methods: list,
+                        url: str,
+                        page: Optional[FetchedPage],
+                        domain: str) -> Optional[Dict[str, any]]:
+        """Run the planned strategies until one yields usable content.
+
+        The HTTP-based methods all parse the one downloaded page, so they run
+        in planned order and the first usable result wins; Selenium only
+        starts once every one of them has failed.
+        """
+        for method in http_methods + browser_methods:
+            result = self._run_method(method, url, page, domain)
+            if result:
+                return result
+        return None
+
+    @property
+    def scraper(self):
+        """Cloudscraper session, created on the first page fetch."""
+        with self._scraper_lock:
+            if self._scraper is None:
+                cloudscraper = lazy_import('cloudscraper')
+                scraper = cloudscraper.create_scraper()
+                http = HttpClient.shared()
+                # Status retries would replay Cloudflare challenge responses
+                # that cloudscraper needs to see; retry connection errors only.
+                http.mount(scraper, 'http://', http.adapter(retry_statuses=()))
+                # Rebuild cloudscraper's TLS cipher adapter with our pool sizes.
+                http.mount(scraper, 'https://', http.adapter(
+                    retry_statuses=(),
+                    adapter_class=cloudscraper.CipherSuiteAdapter,
+                    cipherSuite=scraper.cipherSuite,
+                    ecdhCurve=scraper.ecdhCurve,
+                    server_hostname=scraper.server_hostname,
+                    source_address=scraper.source_address,
+                    ssl_context=scraper.ssl_context))
+                self._scraper = scraper
+            return self._scraper
+
+    def close(self):
+        """Shut down pooled browsers and save strategy stats."""
+        self.browser_pool.shutdown()
+        self.strategy_stats.save()
+
+    def _run_method(self, method, url: str, page: Optional[FetchedPage],
+                    domain: str) -> Optional[Dict[str, any]]:
+        """Run one strategy and record its outcome for the domain."""
+        started = time.monotonic()
+        try:
+            result = method(url, page)
+        except Exception as e:
+            logger.debug(f"Method {method.__name__} failed: {e}")
+            result = None
+
+        # A failed fetch says nothing about how well a parser suits the site.
+        if page or method == self._try_selenium_extraction:
+            self.strategy_stats.record(domain, method.__name__, bool(result),
+                                       time.monotonic() - started)
+        return result
+
+    def _find_canonical_url(self, page: FetchedPage) -> Optional[str]:
+        """Return the page's <link rel=canonical> target, if it is plausible.
+
+        Some sites point every page's canonical at the home or a section
+        page, which would alias all their articles to one cache entry. A
+        canonical on another host, at the site root, or with a shorter path
+        than the page itself is ignored.
+        """
+        import re
+
+        head = page.text[:65536]
+        for tag in re.findall(r'<link\b[^>]*>', head, re.I):
+            if not re.search(r'\brel=["\']?canonical\b', tag, re.I):
+                continue
+            href = re.search(r'\bhref=["\']?([^"\'\s>]+)', tag, re.I)
+            if not href:
+                continue
+            canonical = urljoin(page.url, href.group(1))
+            canonical_path = urlparse(canonical).path.rstrip('/')
+            page_path = urlparse(page.url).path.rstrip('/')
+            if (self._get_domain(canonical) != self._get_domain(page.url)
+                    or not canonical_path
+                    or len(canonical_path) < len(page_path)):
+                logger.debug(f"Ignoring canonical URL {canonical} for {page.url}")
+                return None
+            return canonical
+        return None
+
+    def _get_domain(self, url: str) -> str:
+        """Host name without a leading www., used to key strategy stats."""
+        try:
+            domain = urlparse(url).netloc.lower()
+        except Exception:
+            return ""
+        return domain[4:] if domain.startswith('www.') else domain
+
+    def _preflight(self, url: str) -> PreflightResult:
+        """Look at a link's headers before downloading it, cached per URL.
+
+        Uses HEAD, falling back to a streamed GET that is closed as soon as
+        the headers arrive for servers that refuse HEAD. Network errors give
+        an empty result so the strategies still get their chance.
+        """
+        with self._preflight_lock:
+            cached = self._preflights.get(url)
+            if cached and time.time() - cached.checked_at < Config.PREFLIGHT_CACHE_TTL:
+                return cached
+
+        try:
+            response = self.scraper.head(url,
+                                         headers=self.REQUEST_HEADERS,
+                                         timeout=Config.PREFLIGHT_TIMEOUT,
+                                         allow_redirects=True)
+            if response.status_code >= 400:
+                response = self.scraper.get(url,
+                                            headers=self.REQUEST_HEADERS,
+                                            timeout=Config.PREFLIGHT_TIMEOUT,
+                                            stream=True)
+                response.close()
+
+            content_type = response.headers.get('Content-Type', '')
+            content_length = response.headers.get('Content-Length')
+            result = PreflightResult(
+                url=response.url,
+                content_type=content_type.split(';')[0].strip().lower(),
+                content_length=int(content_length)
+                if content_length and content_length.isdigit() else None)
+            if response.url != url:
+                logger.debug(f"{url} redirects to {response.url}")
+        except Exception as e:
+            logger.debug(f"Pre-flight failed for {url}: {e}")
+            result = PreflightResult(url=url)
+
+        with self._preflight_lock:
+            now = time.time()
+            self._preflights = {
+                key: value
+                for key, value in self._preflights.items()
+                if now - value.checked_at < Config.PREFLIGHT_CACHE_TTL
+            }
+            self._preflights[url] = result
+        return result
+
+    def _fetch_page(self, url: str) -> Optional[FetchedPage]:
+        """Download a page once for all HTTP-based strategies."""
+        try:
+            logger.info("Fetching page...")
+            response = self.scraper.get(url,
+                                        headers=self.REQUEST_HEADERS,
+                                        timeout=15,
+                                        stream=True)
+            response.raise_for_status()
+
+            # Enforce the byte cap before anything is parsed
+            declared = response.headers.get('Content-Length', '')
+            if declared.isdigit() and int(declared) > Config.MAX_PAGE_BYTES:
+                response.close()
+                logger.info(f"Page too large to parse ({declared} bytes)")
+                return None
+            try:
+                return self._stream_page(response)
+            finally:
+                response.close()
+        except Exception as e:
+            logger.debug(f"Page fetch failed: {e}")
+            return None
+
+    def _stream_page(self, response) -> FetchedPage:
+        """Read a streamed response, decoding and parsing as chunks arrive.
 
-        for method in methods:
+        Reading stops at MAX_PAGE_BYTES, or once the paragraphs parsed so
+        far hold FETCH_ENOUGH_TEXT characters, which is more article text
+        than any strategy needs.
+        """
+        import codecs
+        etree = lazy_import('lxml.etree')
+
+        chunks = []
+        pieces = []
+        size = 0
+        paragraph_chars = 0
+        encoding = decoder = parser = None
+
+        def feed(data: bytes, final: bool = False):
+            nonlocal paragraph_chars, parser
+            text = decoder.decode(data, final)
+            pieces.append(text)
+            if parser is None or not text:
+                return
             try:
-                result = method(url)
-                if result:
-                    return result
+                parser.feed(text)
+                for _, paragraph in parser.read_events():
+                    paragraph_chars += len(''.join(paragraph.itertext()))
             except Exception as e:
-                logger.debug(f"Method {method.__name__} failed: {e}")
+                logger.debug(f"Incremental parse failed: {e}")
+                parser = None
+
+        for chunk in response.iter_content(
+                chunk_size=Config.FETCH_CHUNK_BYTES):
+            if not chunk:
                 continue
+            chunks.append(chunk)
+            size += len(chunk)
 
-        logger.warning(f"All extraction methods failed for URL: {url}")
-        return None
+            if decoder is None:
+                # Wait for enough bytes to see a <meta> charset
+                if size < 4096:
+                    continue
+                head = b''.join(chunks)
+                encoding = self._detect_encoding(response.headers, head)
+                decoder = codecs.getincrementaldecoder(encoding)(
+                    errors='replace')
+                parser = etree.HTMLPullParser(events=('end', ), tag='p')
+                feed(head)
+            else:
+                feed(chunk)
+
+            if size >= Config.MAX_PAGE_BYTES:
+                logger.info(f"Page truncated at {size} bytes")
+                break
+            if paragraph_chars >= Config.FETCH_ENOUGH_TEXT:
+                logger.debug(
+                    f"Collected {paragraph_chars} characters of paragraphs after {size} bytes"
+                )
+                break
+
+        content = b''.join(chunks)
+        if decoder is None:
+            encoding = self._detect_encoding(response.headers, content)
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            parser = etree.HTMLPullParser(events=('end', ), tag='p')
+            feed(content)
+        feed(b'', final=True)
+
+        tree = None
+        if parser is not None:
+            try:
+                tree = parser.close()
+            except Exception as e:
+                logger.debug(f"Incremental parse failed: {e}")
+
+        return FetchedPage(url=response.url,
+                           status_code=response.status_code,
+                           headers=dict(response.headers),
+                           content=content,
+                           encoding=encoding,
+                           text=''.join(pieces),
+                           tree=tree)
+
+    def _detect_encoding(self, headers, content: bytes) -> str:
+        """Pick the page encoding from the headers or a <meta> charset."""
+        import re
+        import codecs
+
+        candidates = []
+        header_match = re.search(r'charset=["\']?([\w-]+)',
+                                 headers.get('Content-Type', ''), re.I)
+        if header_match:
+            candidates.append(header_match.group(1))
+        meta_match = re.search(rb'<meta[^>]+charset=["\']?([\w-]+)',
+                               content[:4096], re.I)
+        if meta_match:
+            candidates.append(meta_match.group(1).decode('ascii'))
+
+        for candidate in candidates:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                continue
+        return 'utf-8'
 
-    def _try_newspaper_extraction(self, url: str) -> Optional[Dict[str, any]]:
+    def _try_newspaper_extraction(
+            self, url: str,
+            page: Optional[FetchedPage]) -> Optional[Dict[str, any]]:
         """Try extraction using newspaper3k."""
+        if not page:
+            return None
         try:
             logger.info("Trying newspaper extraction...")
+            newspaper = lazy_import('newspaper')
             article = newspaper.Article(url)
-            article.download()
+            article.download(input_html=page.text)
             article.parse()
 
             if article.text and len(article.text.split()) >= 50:
@@ -122,58 +1397,56 @@ class ContentExtractor:
             logger.debug(f"Newspaper extraction failed: {e}")
         return None
 
-    def _try_selenium_extraction(self, url: str) -> Optional[Dict[str, any]]:
+    def _try_selenium_extraction(
+            self, url: str,
+            page: Optional[FetchedPage]) -> Optional[Dict[str, any]]:
         """Try extraction using Selenium for dynamic content."""
-        driver = None
         try:
             logger.info("Trying Selenium extraction...")
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument(
-                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(url)
+            WebDriverWait = lazy_import(
+                'selenium.webdriver.support.ui').WebDriverWait
+            TimeoutException = lazy_import(
+                'selenium.common.exceptions').TimeoutException
 
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body")))
+            with self.browser_pool.browser() as driver:
+                try:
+                    driver.get(url)
+                except TimeoutException:
+                    # Eager loading gives up on slow subresources; whatever
+                    # DOM we have so far is still worth parsing.
+                    logger.debug(f"Page load timed out for {url}")
+
+                # Wait for the DOM only; "complete" would mean every image
+                # and ad again, which eager loading exists to skip.
+                try:
+                    WebDriverWait(driver, Config.BROWSER_PAGE_TIMEOUT).until(
+                        lambda d: d.execute_script(
+                            "return document.readyState") != "loading")
+                except TimeoutException:
+                    logger.debug(f"Page DOM never finished loading: {url}")
 
-            time.sleep(3)
+                page_source = driver.page_source
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            content = self._extract_with_advanced_selectors(soup)
+            content = self._extract_with_advanced_selectors(
+                self._parse_html(page_source))
 
             if content and len(content.split()) >= 50:
                 return self._process_extracted_content(content)
 
         except Exception as e:
             logger.debug(f"Selenium extraction failed: {e}")
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    logger.debug(f"Error closing driver: {e}")
         return None
 
-    def _try_readability_extraction(self,
-                                    url: str) -> Optional[Dict[str, any]]:
+    def _try_readability_extraction(
+            self, url: str,
+            page: Optional[FetchedPage]) -> Optional[Dict[str, any]]:
         """Try extraction using readability-lxml."""
+        if not page:
+            return None
         try:
             logger.info("Trying readability extraction...")
-            headers = {
-                "User-Agent":
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            doc = Document(response.text)
+            Document = lazy_import('readability.readability').Document
+            doc = Document(page.text)
             html = doc.summary()
             soup = BeautifulSoup(html, 'html.parser')
             content = soup.get_text(separator=' ').strip()
@@ -185,48 +1458,34 @@ class ContentExtractor:
             logger.debug(f"Readability extraction failed: {e}")
         return None
 
-    def _try_basic_requests(self, url: str) -> Optional[Dict[str, any]]:
-        """Basic requests extraction as last resort."""
+    def _try_selector_extraction(
+            self, url: str,
+            page: Optional[FetchedPage]) -> Optional[Dict[str, any]]:
+        """CSS selector extraction as last resort."""
+        if not page:
+            return None
         try:
-            logger.info("Trying basic requests extraction...")
-            headers = {
-                "User-Agent":
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept":
-                "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
-            }
-
-            response = self.scraper.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            content = self._extract_with_advanced_selectors(soup)
+            logger.info("Trying selector extraction...")
+            tree = page.tree if page.tree is not None else self._parse_html(
+                page.text)
+            content = self._extract_with_advanced_selectors(tree)
 
             if content and len(content.split()) >= 50:
                 return self._process_extracted_content(content)
 
         except Exception as e:
-            logger.debug(f"Basic requests extraction failed: {e}")
+            logger.debug(f"Selector extraction failed: {e}")
         return None
 
-    def _extract_with_advanced_selectors(self, soup: BeautifulSoup) -> str:
+    def _extract_with_advanced_selectors(self, tree) -> str:
         """Extract content using multiple CSS selectors."""
-        selectors = [
-            'article', '[role="main"]', '.content', '.article-content',
-            '.post-content', '.entry-content', 'main', '#content',
-            '.story-body', 'div[data-component="text-block"]'
-        ]
-
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                content = ' '.join(
-                    elem.get_text(separator=' ').strip() for elem in elements)
-                if len(content.split()) >= 30:
-                    return content
+        return self.selector_engine.extract(tree)
 
-        paragraphs = soup.find_all('p')
-        return ' '.join(p.get_text(separator=' ').strip() for p in paragraphs)
+    def _parse_html(self, html: str):
+        """Parse an HTML string into an lxml tree (None if empty)."""
+        etree = lazy_import('lxml.etree')
+        return etree.fromstring(html.encode('utf-8'),
+                                etree.HTMLParser(encoding='utf-8'))
 
     def _process_extracted_content(self, content: str) -> Dict[str, any]:
         """Process and validate extracted content."""
@@ -240,6 +1499,300 @@ class ContentExtractor:
         }
 
 
+def has_repeated_phrases(words: list) -> bool:
+    """True if any 3-word sequence occurs twice in a list of words."""
+    if len(words) < 6:  # Need at least 6 words to repeat a 3-word phrase
+        return False
+    seen = set()
+    for phrase in zip(words, words[1:], words[2:]):
+        if phrase in seen:
+            return True
+        seen.add(phrase)
+    return False
+
+
+class SentenceFilter:
+    """Compiled promotional-content rules for SumySummarizer.
+
+    All patterns are folded into one alternation regex and the promotional
+    substrings into another, so each sentence is classified by a couple of
+    linear regex scans instead of a Python loop over every rule.
+    """
+
+    def __init__(self, clean_patterns: list, filter_patterns: list,
+                 promotional_words: Set[str]):
+        import re
+
+        self.clean_regex = self._compile_alternation(clean_patterns)
+        self.filter_regex = self._compile_alternation(filter_patterns,
+                                                      re.IGNORECASE)
+        # Matches once per whitespace-delimited word that contains any
+        # promotional substring; the lookbehind stops it from retrying
+        # in the middle of a word.
+        promo_alternation = '|'.join(
+            re.escape(word)
+            for word in sorted(promotional_words, key=len, reverse=True))
+        self.promo_word_regex = re.compile(
+            rf'(?<!\S)\S*?(?:{promo_alternation})'
+            if promo_alternation else r'(?!)')
+
+    def _compile_alternation(self, patterns: list, flags: int = 0):
+        import re
+
+        if not patterns:
+            return re.compile(r'(?!)')  # Never matches
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns),
+                          flags)
+
+    def is_clean(self, sentence: str) -> bool:
+        """Return True if a stripped sentence should be kept in the text."""
+        sentence_lower = sentence.lower()
+        words = sentence_lower.split()
+
+        # Skip very short sentences (likely fragments)
+        if len(words) < 5:
+            return False
+
+        if self.clean_regex.search(sentence_lower):
+            return False
+
+        # Skip sentences with repetitive phrases (3+ word sequences)
+        if has_repeated_phrases(words):
+            return False
+
+        # Skip sentences that are mostly promotional/subscription words
+        promo_word_count = len(self.promo_word_regex.findall(sentence_lower))
+        if promo_word_count / len(words) > 0.25:
+            return False
+
+        # Skip sentences with excessive capitalization (likely promotional)
+        if sum(map(str.isupper, sentence)) > len(sentence) * 0.3:
+            return False
+
+        return True
+
+    def contains_promotional(self, text: str) -> bool:
+        """Check if text matches any of the summary filter patterns."""
+        return self.filter_regex.search(text) is not None
+
+
+class SummarizerBackend(ABC):
+    """Chooses which sentences of an article make up its summary."""
+
+    name = "base"
+
+    def __init__(self, language: str, promotional_words: Set[str]):
+        self.language = language
+        self.promotional_words = promotional_words
+
+    @abstractmethod
+    def select_sentences(self, sentences: list, count: int) -> list:
+        """Return up to count sentences for the summary."""
+
+
+class HeuristicBackend(SummarizerBackend):
+    """Scores sentences on position, length and keyword indicators."""
+
+    name = "heuristic"
+
+    def select_sentences(self, sentences: list, count: int) -> list:
+        """Intelligently select the best sentences for summary."""
+        if len(sentences) <= count:
+            return sentences
+
+        # Score sentences based on content quality indicators
+        scored_sentences = []
+        for i, sentence in enumerate(sentences):
+            score = self._score_sentence(sentence, i, len(sentences))
+            scored_sentences.append((sentence, score))
+
+        # Sort by score (highest first)
+        scored_sentences.sort(key=lambda x: x[1], reverse=True)
+
+        # Select top sentences
+        selected = [sentence for sentence, score in scored_sentences[:count]]
+        return selected
+
+    def _score_sentence(self, sentence: str, position: int,
+                        total_sentences: int) -> float:
+        """Score a sentence based on content quality indicators."""
+        score = 0.0
+        words = sentence.lower().split()
+
+        # Position bonus (first few sentences are often important)
+        if position < 3:
+            score += 0.3
+        elif position < total_sentences // 3:
+            score += 0.2
+
+        # Length penalty for very long or short sentences
+        if 8 <= len(words) <= 25:
+            score += 0.2
+        elif len(words) < 5 or len(words) > 35:
+            score -= 0.3
+
+        # Bonus for sentences with numbers (often factual)
+        if any(word.isdigit() or any(char.isdigit() for char in word)
+               for word in words):
+            score += 0.1
+
+        # Penalty for sentences with too many promotional words
+        promo_count = sum(1 for word in words
+                          if word in self.promotional_words)
+        if promo_count > 0:
+            score -= promo_count * 0.2
+
+        # Bonus for sentences with important keywords
+        important_keywords = {
+            'said', 'reported', 'according', 'announced', 'confirmed',
+            'revealed'
+        }
+        if any(keyword in words for keyword in important_keywords):
+            score += 0.15
+
+        return score
+
+
+class VectorBackend(SummarizerBackend):
+    """Base for backends that work on a sparse TF-IDF sentence matrix.
+
+    Sentences beyond Config.SUMMARIZER_MAX_SENTENCES are ignored to keep
+    the cost bounded on very long articles. Selected sentences are
+    returned in article order.
+    """
+
+    def __init__(self, language: str, promotional_words: Set[str]):
+        super().__init__(language, promotional_words)
+        # Fail at construction time if the numeric stack is missing.
+        lazy_import('numpy')
+        lazy_import('scipy.sparse')
+
+        Stemmer = lazy_import('sumy.nlp.stemmers').Stemmer
+        get_stop_words = lazy_import('sumy.utils').get_stop_words
+        self.stemmer = Stemmer(language)
+        self.stop_words = frozenset(get_stop_words(language))
+
+    def select_sentences(self, sentences: list, count: int) -> list:
+        """Pick the highest scoring sentences, kept in article order."""
+        import numpy as np
+
+        if len(sentences) <= count:
+            return sentences
+
+        candidates = sentences[:Config.SUMMARIZER_MAX_SENTENCES]
+        matrix = self._sentence_matrix(candidates)
+        if matrix.shape[1] == 0:
+            return candidates[:count]
+
+        scores = self._score_sentences(matrix)
+        # Stable sort so ties favour earlier sentences.
+        top = np.argsort(-scores, kind='stable')[:count]
+        return [candidates[i] for i in sorted(top)]
+
+    @abstractmethod
+    def _score_sentences(self, matrix) -> 'np.ndarray':
+        """Score each row of the sentence matrix; higher is better."""
+
+    def _sentence_matrix(self, sentences: list):
+        """Row-normalized TF-IDF matrix with one row per sentence."""
+        import re
+        import numpy as np
+        from scipy import sparse
+
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for i, sentence in enumerate(sentences):
+            for word in re.findall(r"[a-z0-9]+(?:'[a-z]+)?", sentence.lower()):
+                if word in self.stop_words:
+                    continue
+                term = self.stemmer(word)
+                rows.append(i)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+
+        term_freq = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(sentences), len(vocabulary)))
+        term_freq.sum_duplicates()
+
+        doc_freq = np.bincount(term_freq.indices, minlength=len(vocabulary))
+        idf = np.log((1 + len(sentences)) / (1 + doc_freq)) + 1
+        tfidf = term_freq.multiply(idf).tocsr()
+
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1))).ravel()
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ tfidf
+
+    def _pagerank(self, similarity, damping: float = 0.85,
+                  tolerance: float = 1e-6,
+                  max_iterations: int = 100) -> 'np.ndarray':
+        """Stationary distribution of a random walk over sentence links."""
+        import numpy as np
+        from scipy import sparse
+
+        n = similarity.shape[0]
+        similarity = similarity.tolil()
+        similarity.setdiag(0)
+        similarity = similarity.tocsr()
+        similarity.eliminate_zeros()
+
+        out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        out_weight[dangling] = 1
+        transition = (sparse.diags(1 / out_weight) @ similarity).T.tocsr()
+
+        ranks = np.full(n, 1 / n)
+        for _ in range(max_iterations):
+            # Sentences with no links spread their rank evenly.
+            dangling_mass = ranks[dangling].sum() / n
+            updated = (1 - damping) / n + damping * (transition @ ranks +
+                                                     dangling_mass)
+            if np.abs(updated - ranks).sum() < tolerance:
+                return updated
+            ranks = updated
+        return ranks
+
+
+class LsaBackend(VectorBackend):
+    """Latent semantic analysis (Steinberger and Jezek sentence length)."""
+
+    name = "lsa"
+
+    def _score_sentences(self, matrix) -> 'np.ndarray':
+        import numpy as np
+        from scipy.sparse.linalg import svds
+
+        dimensions = min(matrix.shape) - 1
+        if dimensions < 1:
+            # Too small for a truncated SVD; do it densely.
+            u, sigma, _ = np.linalg.svd(matrix.toarray(),
+                                        full_matrices=False)
+        else:
+            u, sigma, _ = svds(matrix, k=min(dimensions, 10))
+        return np.sqrt(((u * sigma)**2).sum(axis=1))
+
+
+class TextRankBackend(VectorBackend):
+    """PageRank over the weighted cosine similarity graph of sentences."""
+
+    name = "textrank"
+
+    def _score_sentences(self, matrix) -> 'np.ndarray':
+        return self._pagerank(matrix @ matrix.T)
+
+
+class LexRankBackend(VectorBackend):
+    """PageRank over sentence pairs above a cosine similarity threshold."""
+
+    name = "lexrank"
+    THRESHOLD = 0.1
+
+    def _score_sentences(self, matrix) -> 'np.ndarray':
+        similarity = (matrix @ matrix.T).tocsr()
+        similarity.data = (similarity.data >= self.THRESHOLD).astype(float)
+        similarity.eliminate_zeros()
+        return self._pagerank(similarity)
+
+
 class SumySummarizer:
 
     def __init__(self):
@@ -271,7 +1824,85 @@ class SumySummarizer:
             'quality', 'ft', 'financial', 'times'
         }
 
-    def generate_summary(self, content: str) -> Optional[str]:
+        # Stricter patterns applied when cleaning the raw article text
+        self.clean_patterns = self.filter_patterns + [
+            r'complete\s+digital\s+access',
+            r'quality\s+.*\s+journalism',
+            r'pay\s+.*\s+upfront\s+and\s+save',
+            r'expert\s+analysis\s+from\s+industry\s+leaders',
+            r'subscribe\s+for\s+.*\s+per\s+month',
+            r'unlimited\s+access\s+to',
+            r'premium\s+subscription',
+            r'free\s+trial',
+            r'cancel\s+anytime',
+            r'billed\s+monthly',
+            r'special\s+offer',
+            r'limited\s+time\s+offer',
+        ]
+
+        self._load_filter_rules()
+        self.sentence_filter = SentenceFilter(self.clean_patterns,
+                                              self.filter_patterns,
+                                              self.promotional_words)
+        self.backend = self._create_backend(Config.SUMMARIZER_BACKEND)
+
+    def _create_backend(self, name: str) -> 'SummarizerBackend':
+        """Build the configured sentence selection backend."""
+        backends = {
+            'heuristic': HeuristicBackend,
+            'lsa': LsaBackend,
+            'textrank': TextRankBackend,
+            'lexrank': LexRankBackend,
+        }
+        backend_class = backends.get(name.lower())
+        if backend_class is None:
+            logger.warning(
+                f"Unknown summarizer backend '{name}', using heuristic")
+            backend_class = HeuristicBackend
+
+        try:
+            backend = backend_class(self.language, self.promotional_words)
+        except ImportError as e:
+            logger.warning(
+                f"Summarizer backend '{name}' unavailable ({e}), using heuristic"
+            )
+            backend = HeuristicBackend(self.language, self.promotional_words)
+
+        logger.info(f"Using {backend.name} summarizer backend")
+        return backend
+
+    def _load_filter_rules(self):
+        """Merge extra filter rules from Config.FILTER_RULES_FILE, if present.
+
+        The file is JSON with optional "clean_patterns", "filter_patterns"
+        and "promotional_words" lists, added to the built-in rules.
+        """
+        import re
+
+        try:
+            if not os.path.exists(Config.FILTER_RULES_FILE):
+                return
+            with open(Config.FILTER_RULES_FILE, 'r') as f:
+                rules = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading filter rules: {e}")
+            return
+
+        for key in ('clean_patterns', 'filter_patterns'):
+            for pattern in rules.get(key, []):
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    logger.warning(f"Ignoring invalid filter pattern {pattern!r}: {e}")
+                    continue
+                getattr(self, key).append(pattern)
+        self.promotional_words.update(
+            word.lower() for word in rules.get('promotional_words', []))
+        logger.info(f"Loaded extra filter rules from {Config.FILTER_RULES_FILE}")
+
+    def generate_summary(self,
+                         content: str,
+                         sentence_count: Optional[int] = None) -> Optional[str]:
         """Generate enhanced summary with content filtering and formatting."""
         try:
             # Clean and filter content first
@@ -294,7 +1925,8 @@ class SumySummarizer:
                 return "No summary could be extracted from the news article."
 
             # Intelligent sentence selection for better summary quality
-            selected_sentences = self._select_best_sentences(sentences)
+            selected_sentences = self._select_best_sentences(
+                sentences, sentence_count)
 
             # Filter and format sentences
             filtered_sentences = self._filter_sentences(selected_sentences)
@@ -319,37 +1951,6 @@ class SumySummarizer:
         """Remove promotional and irrelevant content with enhanced filtering."""
         import re
 
-        # Enhanced promotional patterns
-        enhanced_patterns = [
-            r'subscribe\s+to\s+our\s+newsletter',
-            r'click\s+here\s+to\s+learn\s+more',
-            r'advertisement',
-            r'sponsored\s+content',
-            r'follow\s+us\s+on\s+social\s+media',
-            r'share\s+this\s+article',
-            r'related\s+articles?',
-            r'more\s+from\s+this\s+author',
-            r'get\s+our\s+free\s+newsletter',
-            r'sign\s+up\s+for\s+updates',
-            r'download\s+our\s+app',
-            r'join\s+our\s+community',
-            r'cookie\s+policy',
-            r'privacy\s+policy',
-            r'terms\s+of\s+service',
-            r'complete\s+digital\s+access',
-            r'quality\s+.*\s+journalism',
-            r'pay\s+.*\s+upfront\s+and\s+save',
-            r'expert\s+analysis\s+from\s+industry\s+leaders',
-            r'subscribe\s+for\s+.*\s+per\s+month',
-            r'unlimited\s+access\s+to',
-            r'premium\s+subscription',
-            r'free\s+trial',
-            r'cancel\s+anytime',
-            r'billed\s+monthly',
-            r'special\s+offer',
-            r'limited\s+time\s+offer',
-        ]
-
         # Split into sentences
         sentences = re.split(r'[.!?]+', content)
         clean_sentences = []
@@ -359,64 +1960,14 @@ class SumySummarizer:
             if not sentence:
                 continue
 
-            # Skip very short sentences (likely fragments)
-            if len(sentence.split()) < 5:
-                continue
-
-            # Enhanced promotional content detection
-            sentence_lower = sentence.lower()
-
-            # Check against enhanced patterns
-            if any(
-                    re.search(pattern, sentence_lower)
-                    for pattern in enhanced_patterns):
-                continue
-
-            # Skip sentences with repetitive phrases (3+ word sequences)
-            words = sentence_lower.split()
-            if self._has_repetitive_phrases(words):
-                continue
-
-            # Skip sentences that are mostly promotional/subscription words
-            promo_word_count = sum(1 for word in words if any(
-                promo in word for promo in self.promotional_words))
-            if len(words) > 0 and (promo_word_count /
-                                   len(words)) > 0.25:  # Lowered threshold
-                continue
-
-            # Skip sentences with excessive capitalization (likely promotional)
-            if sum(1 for c in sentence if c.isupper()) > len(sentence) * 0.3:
-                continue
-
-            clean_sentences.append(sentence)
+            if self.sentence_filter.is_clean(sentence):
+                clean_sentences.append(sentence)
 
         return '. '.join(clean_sentences)
 
     def _contains_promotional_content(self, text: str) -> bool:
         """Check if text contains promotional patterns."""
-        import re
-
-        for pattern in self.filter_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
-
-    def _has_repetitive_phrases(self, words: list) -> bool:
-        """Check if sentence contains repetitive phrases (3+ word sequences)."""
-        if len(
-                words
-        ) < 6:  # Need at least 6 words to have repetitive 3-word phrases
-            return False
-
-        # Create 3-word phrases
-        phrases = []
-        for i in range(len(words) - 2):
-            phrase = ' '.join(words[i:i + 3])
-            phrases.append(phrase)
-
-        # Check for duplicates
-        unique_phrases = set(phrases)
-        return len(phrases) > len(unique_phrases)
+        return self.sentence_filter.contains_promotional(text)
 
     def _filter_sentences(self, sentences) -> list:
         """Filter out low-quality sentences."""
@@ -444,65 +1995,12 @@ class SumySummarizer:
 
         return filtered
 
-    def _select_best_sentences(self, sentences: list) -> list:
+    def _select_best_sentences(self,
+                               sentences: list,
+                               sentence_count: Optional[int] = None) -> list:
         """Intelligently select the best sentences for summary."""
-        if len(sentences) <= self.sentence_count:
-            return sentences
-
-        # Score sentences based on content quality indicators
-        scored_sentences = []
-        for i, sentence in enumerate(sentences):
-            score = self._score_sentence(sentence, i, len(sentences))
-            scored_sentences.append((sentence, score))
-
-        # Sort by score (highest first)
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-
-        # Select top sentences
-        selected = [
-            sentence
-            for sentence, score in scored_sentences[:self.sentence_count]
-        ]
-        return selected
-
-    def _score_sentence(self, sentence: str, position: int,
-                        total_sentences: int) -> float:
-        """Score a sentence based on content quality indicators."""
-        score = 0.0
-        words = sentence.lower().split()
-
-        # Position bonus (first few sentences are often important)
-        if position < 3:
-            score += 0.3
-        elif position < total_sentences // 3:
-            score += 0.2
-
-        # Length penalty for very long or short sentences
-        if 8 <= len(words) <= 25:
-            score += 0.2
-        elif len(words) < 5 or len(words) > 35:
-            score -= 0.3
-
-        # Bonus for sentences with numbers (often factual)
-        if any(word.isdigit() or any(char.isdigit() for char in word)
-               for word in words):
-            score += 0.1
-
-        # Penalty for sentences with too many promotional words
-        promo_count = sum(1 for word in words
-                          if word in self.promotional_words)
-        if promo_count > 0:
-            score -= promo_count * 0.2
-
-        # Bonus for sentences with important keywords
-        important_keywords = {
-            'said', 'reported', 'according', 'announced', 'confirmed',
-            'revealed'
-        }
-        if any(keyword in words for keyword in important_keywords):
-            score += 0.15
-
-        return score
+        return self.backend.select_sentences(
+            sentences, sentence_count or self.sentence_count)
 
     def _is_valid_summary(self, summary: str) -> bool:
         """Validate if the summary meets quality standards."""
@@ -522,7 +2020,7 @@ class SumySummarizer:
             return False
 
         # Check for repetitive content
-        if self._has_repetitive_phrases(words):
+        if has_repeated_phrases(words):
             return False
 
         # Check for meaningful content (not just filler words)
@@ -537,95 +2035,1089 @@ class SumySummarizer:
 
         return True
 
-    def _format_summary(self, sentences: list) -> str:
-        """Format sentences into a well-structured summary."""
-        if not sentences:
-            return ""
+    def _format_summary(self, sentences: list) -> str:
+        """Format sentences into a well-structured summary."""
+        if not sentences:
+            return ""
+
+        # Ensure proper punctuation and capitalization
+        formatted_sentences = []
+
+        for sentence in sentences:
+            sentence = sentence.strip()
+
+            # Ensure sentence starts with capital letter
+            if sentence and sentence[0].islower():
+                sentence = sentence[0].upper() + sentence[1:]
+
+            # Ensure sentence ends with proper punctuation
+            if sentence and sentence[-1] not in '.!?':
+                sentence += '.'
+
+            formatted_sentences.append(sentence)
+
+        # Join sentences with proper spacing
+        summary = ' '.join(formatted_sentences)
+
+        # Clean up any double spaces or punctuation issues
+        import re
+        summary = re.sub(r'\s+', ' ', summary)  # Multiple spaces to single
+        summary = re.sub(r'\.+', '.', summary)  # Multiple periods to single
+        summary = re.sub(r'\s+([.!?])', r'\1',
+                         summary)  # Remove space before punctuation
+
+        return summary.strip()
+
+
+class CommentHistoryManager:
+    """Submissions the bot has commented on, with the time of each comment.
+
+    Stored in SQLite in WAL mode: each mark_commented is a single committed
+    insert, so a crash never loses earlier entries. The table is loaded into
+    memory at startup for lookups. A legacy JSON history is imported once.
+
+    The same database holds the write-ahead intent log: an intent is
+    recorded before replying and cleared by mark_commented, so an intent
+    left behind means the reply's outcome is unknown.
+    """
+
+    def __init__(self, filename: str,
+                 legacy_filename: Optional[str] = Config.COMMENT_HISTORY_LEGACY_FILE):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS commented (
+                submission_id TEXT PRIMARY KEY,
+                commented_at REAL NOT NULL)""")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS intents (
+                submission_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                created_at REAL NOT NULL)""")
+        self.db.commit()
+        if legacy_filename:
+            self._migrate_json(legacy_filename)
+        self.commented_submissions: Dict[str, float] = self._load_history()
+
+    def _migrate_json(self, legacy_filename: str):
+        """Import a comment_history.json written by older versions."""
+        if not os.path.exists(legacy_filename):
+            return
+        try:
+            with open(legacy_filename, 'r') as f:
+                submission_ids = json.load(f).get('commented_submissions', [])
+            # The JSON file kept no timestamps; treat them all as old
+            with self._lock, self.db:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO commented VALUES (?, 0)",
+                    [(submission_id, ) for submission_id in submission_ids])
+            os.replace(legacy_filename, legacy_filename + ".migrated")
+            logger.info(
+                f"Migrated {len(submission_ids)} entries from {legacy_filename}")
+        except Exception as e:
+            logger.error(f"Error migrating comment history: {e}")
+
+    def _load_history(self) -> Dict[str, float]:
+        """Load comment history from the database."""
+        try:
+            with self._lock:
+                rows = self.db.execute(
+                    "SELECT submission_id, commented_at FROM commented"
+                ).fetchall()
+            if not rows:
+                logger.info(
+                    "No previous comment history found, starting fresh")
+            return dict(rows)
+        except Exception as e:
+            logger.error(f"Error loading comment history: {e}")
+            return {}
+
+    def has_commented(self, submission_id: str) -> bool:
+        """Check if we've already commented on this submission."""
+        return submission_id in self.commented_submissions
+
+    def mark_commented(self, submission_id: str):
+        """Mark submission as commented, completing any pending intent."""
+        commented_at = time.time()
+        self.commented_submissions[submission_id] = commented_at
+        try:
+            with self._lock, self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO commented VALUES (?, ?)",
+                    (submission_id, commented_at))
+                self.db.execute("DELETE FROM intents WHERE submission_id = ?",
+                                (submission_id, ))
+        except Exception as e:
+            logger.error(f"Error saving comment history: {e}")
+
+    @staticmethod
+    def content_hash(comment_text: str) -> str:
+        """Hash of a comment body, insensitive to Reddit's entity escaping
+        and whitespace trimming, so a posted body matches its intent."""
+        import html
+        normalized = ' '.join(html.unescape(comment_text).split())
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def record_intent(self, submission_id: str, comment_text: str) -> str:
+        """Durably record that we are about to reply. Returns the content hash."""
+        content_hash = self.content_hash(comment_text)
+        with self._lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO intents VALUES (?, ?, ?)",
+                            (submission_id, content_hash, time.time()))
+        return content_hash
+
+    def clear_intent(self, submission_id: str):
+        """Drop an intent whose reply is known not to exist."""
+        try:
+            with self._lock, self.db:
+                self.db.execute("DELETE FROM intents WHERE submission_id = ?",
+                                (submission_id, ))
+        except Exception as e:
+            logger.error(f"Error clearing comment intent: {e}")
+
+    def has_pending_intent(self, submission_id: str) -> bool:
+        """Check if a reply to this submission has an unknown outcome."""
+        with self._lock:
+            return self.db.execute(
+                "SELECT 1 FROM intents WHERE submission_id = ?",
+                (submission_id, )).fetchone() is not None
+
+    def pending_intents(self) -> list:
+        """Return (submission_id, content_hash, created_at) for open intents."""
+        with self._lock:
+            return self.db.execute(
+                "SELECT submission_id, content_hash, created_at FROM intents"
+            ).fetchall()
+
+    def cleanup_old_entries(self, max_entries: int = 1000):
+        """Keep only the most recently commented entries."""
+        if len(self.commented_submissions) <= max_entries:
+            return
+        try:
+            with self._lock, self.db:
+                self.db.execute(
+                    """DELETE FROM commented WHERE submission_id NOT IN (
+                        SELECT submission_id FROM commented
+                        ORDER BY commented_at DESC LIMIT ?)""",
+                    (max_entries, ))
+            self.commented_submissions = self._load_history()
+        except Exception as e:
+            logger.error(f"Error cleaning up comment history: {e}")
+
+    def close(self):
+        """Checkpoint the WAL and close the database."""
+        try:
+            with self._lock:
+                self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.db.close()
+        except Exception as e:
+            logger.error(f"Error closing comment history: {e}")
+
+
+class PostedCommentIndex:
+    """The bot's summary comments, keyed by submission id.
+
+    Rebuilt at startup from one paginated scan of the bot's own comment
+    listing and updated as comments are posted, so "did we already reply?"
+    is a dict lookup instead of a comment tree download per submission.
+    Each submission maps to its (comment_id, created_utc) pairs, oldest
+    first; more than one entry means a duplicate.
+    """
+
+    SIGNATURE = "This response was automated!"  # Footer of every summary comment
+
+    def __init__(self):
+        self.comments: Dict[str, list] = {}
+        self.body_hashes: Dict[str, str] = {}  # comment id -> content hash
+        self._lock = threading.Lock()
+
+    def rebuild(self, redditor, rate_limiter=None,
+                limit: int = Config.POSTED_INDEX_SCAN_LIMIT) -> bool:
+        """Replace the index with the bot's recent comments.
+
+        Returns False, leaving the index untouched, if the scan failed.
+        """
+        started = time.time()
+        scanned = self._scan(redditor, rate_limiter, limit)
+        if scanned is None:
+            return False
+
+        comments, body_hashes = scanned
+        with self._lock:
+            self.comments = comments
+            self.body_hashes = body_hashes
+        logger.info(
+            f"Indexed comments on {len(comments)} submissions in {time.time() - started:.1f}s"
+        )
+        return True
+
+    def refresh(self, redditor, rate_limiter=None,
+                limit: int = Config.DUPLICATE_SCAN_LIMIT) -> bool:
+        """Merge the bot's newest comments into the index."""
+        scanned = self._scan(redditor, rate_limiter, limit)
+        if scanned is None:
+            return False
 
-        # Ensure proper punctuation and capitalization
-        formatted_sentences = []
+        comments, body_hashes = scanned
+        with self._lock:
+            self.body_hashes.update(body_hashes)
+            for submission_id, entries in comments.items():
+                known = dict(self.comments.get(submission_id, []))
+                known.update(entries)
+                self.comments[submission_id] = sorted(known.items(),
+                                                      key=lambda e: e[1])
+        return True
 
-        for sentence in sentences:
-            sentence = sentence.strip()
+    def _scan(self, redditor, rate_limiter, limit: int) -> Optional[tuple]:
+        """Group the bot's newest summary comments by submission.
 
-            # Ensure sentence starts with capital letter
-            if sentence and sentence[0].islower():
-                sentence = sentence[0].upper() + sentence[1:]
+        Returns (comments by submission, body hash by comment id), or None
+        if the listing could not be read.
+        """
+        comments = {}
+        body_hashes = {}
+        try:
+            for i, comment in enumerate(redditor.comments.new(limit=limit)):
+                # Listings are fetched 100 items per request
+                if rate_limiter and i % 100 == 0:
+                    rate_limiter.acquire('fetch')
+                if self.SIGNATURE not in comment.body:
+                    continue
+                submission_id = comment.link_id.split('_', 1)[-1]
+                comments.setdefault(submission_id, []).append(
+                    (comment.id, comment.created_utc))
+                body_hashes[comment.id] = CommentHistoryManager.content_hash(
+                    comment.body)
+        except Exception as e:
+            logger.error(f"Error scanning posted comments: {e}")
+            return None
+
+        for entries in comments.values():
+            entries.sort(key=lambda e: e[1])
+        return comments, body_hashes
+
+    def record(self, submission_id: str, comment_id: str,
+               created_utc: Optional[float] = None,
+               content_hash: Optional[str] = None):
+        """Add a freshly posted comment."""
+        with self._lock:
+            if content_hash:
+                self.body_hashes[comment_id] = content_hash
+            entries = self.comments.setdefault(submission_id, [])
+            if all(known_id != comment_id for known_id, _ in entries):
+                entries.append((comment_id, created_utc or time.time()))
+                entries.sort(key=lambda e: e[1])
+
+    def remove(self, submission_id: str, comment_id: str):
+        """Forget a deleted comment."""
+        with self._lock:
+            entries = [
+                e for e in self.comments.get(submission_id, [])
+                if e[0] != comment_id
+            ]
+            if entries:
+                self.comments[submission_id] = entries
+            else:
+                self.comments.pop(submission_id, None)
 
-            # Ensure sentence ends with proper punctuation
-            if sentence and sentence[-1] not in '.!?':
-                sentence += '.'
+    def has_commented(self, submission_id: str) -> bool:
+        """Check if the bot has a comment on this submission."""
+        return submission_id in self.comments
+
+    def comments_for(self, submission_id: str) -> list:
+        """Return every known (comment_id, created_utc), oldest first."""
+        with self._lock:
+            return list(self.comments.get(submission_id, []))
+
+
+class DuplicateVerifier:
+    """One scheduler thread that checks posted comments for duplicates.
+
+    Each posted comment gets verification rounds on a heap keyed by due
+    time. When checks come due, a single scan of the bot's newest comments
+    refreshes the PostedCommentIndex; submissions the index shows with only
+    one comment are skipped, and newer copies on the rest are deleted.
+    """
+
+    def __init__(self, reddit, identity, index: PostedCommentIndex,
+                 rate_limiter, notifier,
+                 delays: list = Config.DUPLICATE_CHECK_DELAYS):
+        self.reddit = reddit
+        self.identity = identity
+        self.index = index
+        self.rate_limiter = rate_limiter
+        self.notifier = notifier
+        self.delays = delays
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run,
+                                        name="duplicate-verifier",
+                                        daemon=True)
+        self._thread.start()
+
+    def schedule(self, submission):
+        """Queue the verification rounds for a freshly commented submission."""
+        now = time.time()
+        with self._cond:
+            for delay in self.delays:
+                heapq.heappush(self._heap,
+                               (now + delay, next(self._counter),
+                                submission.id, submission.title))
+            self._cond.notify()
+        logger.info(
+            f"Scheduled {len(self.delays)} duplicate checks for submission {submission.id}"
+        )
 
-            formatted_sentences.append(sentence)
+    def close(self):
+        """Stop the scheduler thread, dropping pending checks."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
 
-        # Join sentences with proper spacing
-        summary = ' '.join(formatted_sentences)
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (not self._heap or
+                                            self._heap[0][0] > time.time()):
+                    timeout = self._heap[0][0] - time.time(
+                    ) if self._heap else None
+                    self._cond.wait(timeout)
+                if self._closed:
+                    return
+
+                # Everything due now shares one listing scan
+                due = {}
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, submission_id, title = heapq.heappop(self._heap)
+                    due[submission_id] = title
 
-        # Clean up any double spaces or punctuation issues
+            try:
+                self._verify(due)
+            except Exception as e:
+                logger.error(f"Error verifying duplicate comments: {e}")
+                self.identity.refresh_on_auth_error(e)
+
+    def _verify(self, due: Dict[str, str]):
+        """Refresh the index once, then delete duplicates on due submissions."""
+        redditor = self.reddit.redditor(self.identity.name)
+        if not self.index.refresh(redditor, self.rate_limiter):
+            return
+
+        for submission_id, title in due.items():
+            entries = self.index.comments_for(submission_id)
+            if len(entries) <= 1:
+                logger.debug(f"No duplicates on submission {submission_id}")
+                continue
+
+            logger.warning(
+                f"DUPLICATE DETECTED: Found {len(entries)} bot comments on submission {submission_id}"
+            )
+            # Keep the oldest comment, remove newer ones
+            removed_count = 0
+            for comment_id, _ in entries[1:]:
+                try:
+                    self.rate_limiter.call('delete',
+                                           self.reddit.comment(comment_id).delete)
+                    self.index.remove(submission_id, comment_id)
+                    logger.info(
+                        f"Successfully deleted duplicate comment {comment_id}")
+                    removed_count += 1
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to delete duplicate comment {comment_id}: {e}")
+
+            if removed_count > 0:
+                self.notifier.send_notification(
+                    "Duplicates Removed",
+                    f"Removed {removed_count} duplicate comments from: {title}",
+                    f"https://redd.it/{submission_id}")
+
+
+class SubmissionWorkQueue:
+    """Bounded priority queue of submissions waiting to be summarized.
+
+    Submissions closest to their age cutoff come out first (or the newest
+    first with order="newest"), so nothing eligible ages out while waiting.
+    When full, the least urgent submission is dropped. A submission stays
+    tracked from put() until done() so re-polls don't queue it twice.
+    """
+
+    def __init__(self, maxsize: int, order: str = "expiry"):
+        self.maxsize = maxsize
+        self.order = order
+        self._heap = []
+        self._tracked: Set[str] = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def put(self, submission, deadline: float) -> bool:
+        """Queue a submission that must be handled before deadline."""
+        if self.order == "newest":
+            priority = -submission.created_utc
+        else:
+            priority = deadline
+        item = (priority, next(self._counter), deadline, submission)
+
+        with self._condition:
+            if submission.id in self._tracked:
+                return False
+
+            if len(self._heap) >= self.maxsize:
+                least_urgent = max(self._heap)
+                if item > least_urgent:
+                    logger.warning(
+                        f"Work queue full, not queueing {submission.id}")
+                    return False
+                self._heap.remove(least_urgent)
+                heapq.heapify(self._heap)
+                self._tracked.discard(least_urgent[3].id)
+                logger.warning(
+                    f"Work queue full, dropped {least_urgent[3].id}")
+
+            heapq.heappush(self._heap, item)
+            self._tracked.add(submission.id)
+            self._condition.notify()
+            return True
+
+    def get(self):
+        """Return the most urgent submission, or None once closed.
+
+        Submissions that passed their deadline while queued are skipped.
+        """
+        with self._condition:
+            while True:
+                while not self._heap and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return None
+
+                _, _, deadline, submission = heapq.heappop(self._heap)
+                if time.time() <= deadline:
+                    return submission
+                logger.warning(
+                    f"Submission {submission.id} aged out while queued")
+                self._tracked.discard(submission.id)
+
+    def done(self, submission_id: str):
+        """Stop tracking a submission once the pipeline is finished with it."""
+        with self._condition:
+            self._tracked.discard(submission_id)
+
+    def close(self):
+        """Wake up every waiting worker and make get() return None."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._heap)
+
+
+class SummaryPipeline:
+    """Extracts an article and summarizes it, using the article cache.
+
+    The cache, extractor (browser pool, strategy stats) and HTTP sessions
+    live only in this process. With PROCESSING_WORKER_MODE = "process",
+    just the CPU-bound summary step is sent to a pool of worker processes,
+    each holding nothing but a summarizer.
+    """
+
+    def __init__(self, cache: ArticleCache, extractor: ContentExtractor,
+                 summarizer: SumySummarizer,
+                 summary_pool: Optional[ProcessPoolExecutor] = None):
+        self.cache = cache
+        self.extractor = extractor
+        self.summarizer = summarizer
+        self.summary_pool = summary_pool
+
+    @classmethod
+    def create(cls) -> 'SummaryPipeline':
+        """Build a pipeline with its own cache, extractor and summarizer."""
+        cache = ArticleCache(Config.ARTICLE_CACHE_DIR, Config.ARTICLE_CACHE_TTL,
+                             Config.ARTICLE_CACHE_MAX_BYTES)
+        summary_pool = None
+        if Config.PROCESSING_WORKER_MODE == "process":
+            # Forking this threaded process could copy a held lock (the
+            # logging handler's, say) into a child that then hangs.
+            summary_pool = ProcessPoolExecutor(
+                max_workers=Config.PROCESSING_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_process_summarizer)
+        return cls(cache, ContentExtractor(cache), SumySummarizer(),
+                   summary_pool)
+
+    def summarize(self,
+                  url: str,
+                  sentence_count: Optional[int] = None) -> Optional[str]:
+        """Return a summary of the article at url, or None."""
+        extracted = self.extractor.extract_content(url)
+        if not extracted:
+            logger.warning(f"Content extraction failed for {url}")
+            return None
+
+        content = extracted['content']
+        word_count = extracted['word_count']
+
+        logger.info(f"Extracted {word_count} words from content")
+
+        if word_count < Config.MIN_CONTENT_LENGTH:
+            logger.warning(f"Content too short ({word_count} words), skipping")
+            return None
+
+        cache_url = extracted.get('canonical_url', url)
+        sentence_count = sentence_count or self.summarizer.sentence_count
+        cache_field = f"summary:{Config.SUMMARIZER_BACKEND}:{sentence_count}"
+        summary = self.cache.get(cache_url, cache_field)
+        if summary:
+            logger.info("Using cached summary")
+        else:
+            if self.summary_pool:
+                summary = self.summary_pool.submit(_summarize_in_process,
+                                                   content,
+                                                   sentence_count).result()
+            else:
+                summary = self.summarizer.generate_summary(
+                    content, sentence_count)
+            if summary:
+                self.cache.put(cache_url, cache_field, summary)
+        if not summary:
+            logger.warning("Summary generation failed")
+            return None
+
+        return summary
+
+    def close(self):
+        """Release extraction resources and stop the summary processes."""
+        if self.summary_pool:
+            self.summary_pool.shutdown(wait=False, cancel_futures=True)
+        self.extractor.close()
+
+
+# Summarizer owned by each worker process when PROCESSING_WORKER_MODE is
+# "process". Workers get extracted text, never URLs, so they hold no cache,
+# browsers or strategy stats of their own.
+_process_summarizer: Optional[SumySummarizer] = None
+
+
+def _init_process_summarizer():
+    """Give a worker process its own summarizer."""
+    global _process_summarizer
+    _process_summarizer = SumySummarizer()
+
+
+def _summarize_in_process(content: str,
+                          sentence_count: Optional[int] = None) -> Optional[str]:
+    """Summarize extracted text inside a worker process."""
+    return _process_summarizer.generate_summary(content, sentence_count)
+
+
+class TokenBucket:
+    """Allows bursts of capacity actions, refilling one every interval."""
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed / self.interval)
+        self._updated = now
+
+    def try_take(self) -> float:
+        """Take a token if one is available; else return seconds to wait."""
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) * self.interval
+
+    def block_for(self, seconds: float):
+        """Hold every action back for seconds, e.g. after a RATELIMIT error."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = 0.0
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    """Token-bucket rate limits per Reddit action.
+
+    Besides the local buckets it respects Reddit's own signals: the
+    X-Ratelimit-Remaining/Reset headers PRAW tracks for the session, and
+    RATELIMIT API errors, which block the action for the delay Reddit
+    states before retrying.
+    """
+
+    def __init__(self, reddit, limits: Dict[str, tuple]):
+        self.reddit = reddit
+        self.buckets = {
+            action: TokenBucket(capacity, interval)
+            for action, (capacity, interval) in limits.items()
+        }
+        self._lock = threading.Lock()
+
+    def acquire(self, action: str):
+        """Block until the action may be performed."""
+        while True:
+            with self._lock:
+                wait = self.buckets[action].try_take()
+            wait = max(wait, self._api_wait())
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limit: waiting {wait:.1f}s before {action}")
+            time.sleep(wait)
+
+    def wait_time(self, action: str) -> float:
+        """Seconds until the action could run, without taking a token."""
+        with self._lock:
+            bucket = self.buckets[action]
+            now = time.monotonic()
+            if now < bucket.blocked_until:
+                return bucket.blocked_until - now
+            bucket._refill(now)
+            local_wait = max(0.0, (1 - bucket.tokens) * bucket.interval)
+        return max(local_wait, self._api_wait())
+
+    def call(self, action: str, func, *args, **kwargs):
+        """Run func under the action's limit, retrying on RATELIMIT errors."""
+        for attempt in range(Config.RATELIMIT_MAX_RETRIES + 1):
+            self.acquire(action)
+            try:
+                return func(*args, **kwargs)
+            except praw.exceptions.RedditAPIException as e:
+                delay = self._ratelimit_delay(e)
+                if delay is None or attempt == Config.RATELIMIT_MAX_RETRIES:
+                    raise
+                logger.warning(
+                    f"Reddit ratelimited {action}; retrying in {delay:.0f} seconds"
+                )
+                with self._lock:
+                    self.buckets[action].block_for(delay)
+
+    def budget(self) -> Dict[str, any]:
+        """Current tokens per action and the API budget from the headers."""
+        with self._lock:
+            now = time.monotonic()
+            budget = {}
+            for action, bucket in self.buckets.items():
+                bucket._refill(now)
+                budget[action] = round(bucket.tokens, 2)
+        remaining, used, reset_in = self._api_state()
+        budget.update({
+            'api_remaining': remaining,
+            'api_used': used,
+            'api_reset_in': reset_in
+        })
+        return budget
+
+    def _api_state(self):
+        """Remaining/used requests and seconds to reset as seen by PRAW."""
+        try:
+            limiter = self.reddit._core._rate_limiter
+        except AttributeError:
+            return None, None, None
+
+        reset_in = None
+        reset_timestamp = getattr(limiter, 'reset_timestamp', None)
+        next_request_ns = getattr(limiter, 'next_request_timestamp_ns', None)
+        if reset_timestamp is not None:
+            reset_in = max(0.0, reset_timestamp - time.time())
+        elif next_request_ns is not None:
+            reset_in = max(0.0, (next_request_ns - time.monotonic_ns()) / 1e9)
+        return getattr(limiter, 'remaining', None), getattr(limiter, 'used',
+                                                            None), reset_in
+
+    def _api_wait(self) -> float:
+        """Seconds to wait when the session's API budget is used up."""
+        remaining, _, reset_in = self._api_state()
+        if remaining is not None and remaining <= 0 and reset_in:
+            return reset_in
+        return 0.0
+
+    def _ratelimit_delay(self, error) -> Optional[float]:
+        """Delay asked for by a RATELIMIT error, or None for other errors."""
         import re
-        summary = re.sub(r'\s+', ' ', summary)  # Multiple spaces to single
-        summary = re.sub(r'\.+', '.', summary)  # Multiple periods to single
-        summary = re.sub(r'\s+([.!?])', r'\1',
-                         summary)  # Remove space before punctuation
 
-        return summary.strip()
+        for item in getattr(error, 'items', []):
+            if item.error_type != 'RATELIMIT':
+                continue
+            match = re.search(r'(\d+)\s*(second|minute|hour)', item.message
+                              or '', re.I)
+            if not match:
+                return 60.0
+            unit = {'second': 1, 'minute': 60, 'hour': 3600}
+            return int(match.group(1)) * unit[match.group(2).lower()] + 1
+        return None
 
 
-class CommentHistoryManager:
+class SubmissionIntake:
+    """Finds new submissions with a persisted before= fullname cursor.
 
-    def __init__(self, filename: str):
-        self.filename = filename
-        self.commented_submissions: Set[str] = self._load_history()
+    Each poll asks Reddit only for posts newer than the last one seen and
+    pages until caught up, so a burst is never cut off at a fixed limit.
+    The cursor is saved after every poll so a restart resumes where the
+    previous run stopped. The poll interval drops to INTAKE_MIN_DELAY while
+    posts keep arriving and backs off to INTAKE_MAX_DELAY when quiet.
 
-    def _load_history(self) -> Set[str]:
-        """Load comment history from file."""
+    Each page is one raw listing request. PRAW's ListingGenerator would
+    follow a short page with an after= request, which for a before= query
+    pages back past the cursor and returns already-seen posts.
+    """
+
+    def __init__(self, subreddit, cursor_file: str):
+        self.subreddit = subreddit
+        self.cursor_file = cursor_file
+        self.cursor: Optional[str] = None
+        self.cursor_created = 0.0
+        self.delay = Config.INTAKE_MIN_DELAY
+        self._empty_polls = 0
+        self._load_cursor()
+
+    def _load_cursor(self):
+        """Load the last seen submission from file."""
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
+            if os.path.exists(self.cursor_file):
+                with open(self.cursor_file, 'r') as f:
                     data = json.load(f)
-                    return set(data.get('commented_submissions', []))
-            else:
-                logger.info(
-                    "No previous comment history found, starting fresh")
-                return set()
+                if data.get('subreddit') == str(self.subreddit):
+                    self.cursor = data.get('fullname')
+                    self.cursor_created = data.get('created_utc', 0.0)
+                    logger.info(f"Resuming intake after {self.cursor}")
         except Exception as e:
-            logger.error(f"Error loading comment history: {e}")
-            return set()
+            logger.error(f"Error loading intake cursor: {e}")
 
-    def _save_history(self):
-        """Save comment history to file."""
+    def _save_cursor(self):
+        """Save the last seen submission to file atomically."""
         try:
-            data = {'commented_submissions': list(self.commented_submissions)}
-            with open(self.filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_filename = f"{self.cursor_file}.tmp"
+            with open(tmp_filename, 'w') as f:
+                json.dump(
+                    {
+                        'subreddit': str(self.subreddit),
+                        'fullname': self.cursor,
+                        'created_utc': self.cursor_created
+                    }, f)
+            os.replace(tmp_filename, self.cursor_file)
         except Exception as e:
-            logger.error(f"Error saving comment history: {e}")
+            logger.error(f"Error saving intake cursor: {e}")
+
+    def poll(self) -> list:
+        """Return submissions newer than the cursor, oldest first."""
+        if self.cursor is None:
+            found = list(reversed(self._fetch_page()))
+        else:
+            found = self._fetch_since_cursor()
+            if found:
+                self._empty_polls = 0
+            else:
+                self._empty_polls += 1
+                if self._empty_polls >= Config.INTAKE_RESYNC_POLLS:
+                    self._empty_polls = 0
+                    found = self._resync()
+
+        if found:
+            self.cursor = found[-1].fullname
+            self.cursor_created = found[-1].created_utc
+            self._save_cursor()
+            self.delay = Config.INTAKE_MIN_DELAY
+        else:
+            self.delay = min(self.delay * 2, Config.INTAKE_MAX_DELAY)
+        return found
+
+    def _fetch_page(self, limit: int = Config.INTAKE_PAGE_SIZE,
+                    before: Optional[str] = None) -> list:
+        """Fetch exactly one page of the new listing, newest first."""
+        params = {'limit': limit}
+        if before:
+            params['before'] = before
+        listing = self.subreddit._reddit.get(
+            f"r/{self.subreddit.display_name}/new", params=params)
+        return list(getattr(listing, 'children', []))
+
+    def _fetch_since_cursor(self) -> list:
+        """Page forward from the cursor until no newer posts remain."""
+        found = []
+        before = self.cursor
+        while True:
+            # Listings are newest first; with before= they hold the posts
+            # immediately newer than the anchor.
+            page = self._fetch_page(before=before)
+            if not page:
+                break
+            found.extend(reversed(page))
+            before = page[0].fullname
+            if len(page) < Config.INTAKE_PAGE_SIZE:
+                break
+        return found
+
+    def _resync(self) -> list:
+        """Recover if the cursor post was removed and before= went blind.
+
+        A deleted anchor makes every before= listing come back empty, so
+        after a run of empty polls check the plain listing once.
+        """
+        latest = self._fetch_page(limit=25)
+        if any(submission.fullname == self.cursor for submission in latest):
+            return []
+        missed = [
+            submission for submission in reversed(latest)
+            if submission.created_utc > self.cursor_created
+        ]
+        logger.warning(
+            f"Intake cursor {self.cursor} no longer listed; resynced with {len(missed)} newer posts"
+        )
+        if not missed and latest:
+            # Re-anchor on the newest post so before= works again.
+            self.cursor = latest[0].fullname
+            self.cursor_created = latest[0].created_utc
+            self._save_cursor()
+        return missed
+
+
+class SubredditSettings:
+    """Settings for one watched subreddit, overriding the global Config."""
+
+    def __init__(self, name: str, overrides: Optional[Dict[str, any]] = None):
+        overrides = overrides or {}
+        self.name = name
+        self.max_post_age_minutes = overrides.get('max_post_age_minutes',
+                                                  Config.MAX_POST_AGE_MINUTES)
+        self.sentences_count = overrides.get('sentences_count',
+                                             Config.SENTENCES_COUNT)
+        self.blocked_domains = {
+            domain.lower()
+            for domain in overrides.get('blocked_domains', [])
+        }
+        self.domain_policy = DomainPolicy.default(self.blocked_domains)
 
-    def has_commented(self, submission_id: str) -> bool:
-        """Check if we've already commented on this submission."""
-        return submission_id in self.commented_submissions
 
-    def mark_commented(self, submission_id: str):
-        """Mark submission as commented."""
-        self.commented_submissions.add(submission_id)
-        self._save_history()
+class DomainPolicy:
+    """Rejects links whose domain or file type is not worth extracting.
 
-    def cleanup_old_entries(self, max_entries: int = 1000):
-        """Keep only the most recent entries."""
-        if len(self.commented_submissions) > max_entries:
-            # Keep the last max_entries
-            recent_entries = list(self.commented_submissions)[-max_entries:]
-            self.commented_submissions = set(recent_entries)
-            self._save_history()
+    Domains are stored in a trie keyed by reversed labels (com -> youtube ->
+    m), so a lookup walks at most one node per label of the host and an
+    entry matches itself and all of its subdomains.
+    """
+
+    def __init__(self):
+        self._trie: Dict[str, dict] = {}
+
+    @classmethod
+    def default(cls, extra_blocked=()) -> 'DomainPolicy':
+        """Build the policy from blacklist.py, Config and extra blocked domains."""
+        policy = cls()
+        for domain in Config.EXCLUDED_DOMAINS:
+            policy.add(domain, "excluded")
+        for domain in Config.MEDIA_DOMAINS:
+            policy.add(domain, "media")
+        for domain in blacklist.blocked:
+            policy.add(domain, "blocked")
+        for domain in extra_blocked:
+            policy.add(domain, "blocked for this subreddit")
+        return policy
+
+    @staticmethod
+    def normalize(entry: str) -> str:
+        """Reduce a domain or URL entry to a bare lowercase host."""
+        entry = entry.strip().lower()
+        if "//" in entry:
+            entry = urlparse(entry).hostname or ""
+        entry = entry.split('/')[0].split(':')[0].strip('.')
+        if entry.startswith('www.'):
+            entry = entry[4:]
+        return entry
+
+    def add(self, domain: str, reason: str):
+        """Reject domain and its subdomains with the given reason."""
+        domain = self.normalize(domain)
+        if not domain:
+            return
+        node = self._trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        # The first reason added for a domain wins
+        node.setdefault(None, reason)
+
+    def match_host(self, host: str) -> Optional[str]:
+        """Return why host is rejected, or None."""
+        node = self._trie
+        for label in reversed(host.lower().strip('.').split('.')):
+            node = node.get(label)
+            if node is None:
+                return None
+            if None in node:
+                return node[None]
+        return None
+
+    def check(self, url: str) -> Optional[str]:
+        """Return why url should not be extracted, or None."""
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return "malformed"
+        reason = self.match_host(parsed.hostname or "")
+        if reason:
+            return reason
+        if parsed.path.lower().endswith(Config.MEDIA_EXTENSIONS):
+            return "media"
+        return None
+
+
+class RelatedNewsFetcher:
+    """Google News RSS searches issued in parallel over the shared HttpClient.
+
+    Results are cached in memory by normalized query for a short TTL, and
+    feeds are parsed with lxml's iterparse, keeping only the first items.
+    """
+
+    RSS_URL = "https://news.google.com/rss/search?q={query}&hl=en-ZA&gl=ZA&ceid=ZA:en"
+    MAX_ITEMS = 10  # Items kept per query, before relevance filtering
+
+    def __init__(self,
+                 ttl: float = Config.RELATED_NEWS_CACHE_TTL,
+                 max_entries: int = Config.RELATED_NEWS_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.http = HttpClient.shared()
+        self.executor = ThreadPoolExecutor(max_workers=3,
+                                           thread_name_prefix="related-news")
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def search(self, search_queries: list) -> list:
+        """Run all queries concurrently; items come back in query order."""
+        futures = [
+            self.executor.submit(self._search_one, search_query)
+            for search_query in search_queries
+        ]
+        news_items = []
+        for search_query, future in zip(search_queries, futures):
+            try:
+                news_items.extend(future.result())
+            except Exception as e:
+                logger.debug(f"Error with search query '{search_query}': {e}")
+        return news_items
+
+    def _search_one(self, search_query: str) -> list:
+        """Fetch one query, from the cache when fresh."""
+        key = " ".join(search_query.lower().split())
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                self._cache.move_to_end(key)
+                return [dict(item) for item in entry[1]]
+
+        response = self.http.get(
+            self.RSS_URL.format(query=requests.utils.quote(search_query)),
+            timeout=Config.RELATED_NEWS_TIMEOUT)
+        response.raise_for_status()
+        items = self._parse_items(response.content, search_query)
+
+        with self._lock:
+            self._cache[key] = (time.time(), items)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return [dict(item) for item in items]
+
+    def _parse_items(self, content: bytes, search_query: str) -> list:
+        """Pull title/link/pubDate out of the first RSS items."""
+        import io
+        etree = lazy_import('lxml.etree')
+
+        items = []
+        for _, element in etree.iterparse(io.BytesIO(content),
+                                          events=('end', ),
+                                          tag='item',
+                                          recover=True):
+            title = element.findtext('title') or ""
+            link = element.findtext('link') or ""
+            pub_date = element.findtext('pubDate') or ""
+            element.clear()
+
+            if title and link:
+                items.append({
+                    "title": title,
+                    "link": link,
+                    "pub_date": pub_date,
+                    "search_query": search_query
+                })
+            if len(items) >= self.MAX_ITEMS:
+                break
+        return items
+
+    def close(self):
+        """Stop the fetch threads."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BotIdentity:
+    """The authenticated account, resolved once and cached.
+
+    "Is this mine?" checks compare against the cached name instead of
+    calling reddit.user.me() each time. The cache is refreshed only when a
+    call fails with an authentication error.
+    """
+
+    AUTH_ERRORS = (prawcore.exceptions.InvalidToken,
+                   prawcore.exceptions.OAuthException)
+
+    def __init__(self, reddit):
+        self.reddit = reddit
+        self.name: Optional[str] = None
+        self.fullname: Optional[str] = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Resolve the account from Reddit."""
+        me = self.reddit.user.me()
+        with self._lock:
+            self.name = me.name
+            self.fullname = me.fullname
+        logger.info(f"Resolved bot identity: {self.name} ({self.fullname})")
+
+    def refresh_on_auth_error(self, error: Exception) -> bool:
+        """Refresh the cached identity if error is an authentication failure."""
+        is_auth_error = isinstance(error, self.AUTH_ERRORS) or (
+            isinstance(error, prawcore.exceptions.ResponseException)
+            and error.response.status_code == 401)
+        if not is_auth_error:
+            return False
+
+        logger.warning(f"Authentication error ({error}); refreshing identity")
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to refresh bot identity: {e}")
+        return True
 
 
 class RedditBot:
 
     def __init__(self):
-        self.extractor = ContentExtractor()
-        self.summarizer = SumySummarizer()
+        logger.info(
+            f"Eager imports took {EAGER_IMPORT_SECONDS * 1000:.0f} ms; heavy dependencies load on first use"
+        )
+        self.pipeline = SummaryPipeline.create()
+        self.extractor = self.pipeline.extractor
+        self.summarizer = self.pipeline.summarizer
         self.notifier = DiscordNotifier(Config.DISCORD_WEBHOOK_URL)
+        self.related_news = RelatedNewsFetcher()
         self.history = CommentHistoryManager(Config.COMMENT_HISTORY_FILE)
+        self.history.cleanup_old_entries(Config.COMMENT_HISTORY_MAX_ENTRIES)
 
         self.reddit = praw.Reddit(
             client_id=Config.REDDIT_CLIENT_ID,
@@ -635,64 +3127,206 @@ class RedditBot:
         )
 
         try:
-            me = self.reddit.user.me()
-            logger.info(f"Successfully authenticated as: {me.name}")
+            self.identity = BotIdentity(self.reddit)
+            logger.info(f"Successfully authenticated as: {self.identity.name}")
             self.notifier.send_notification(
-                "Bot Started", f"Reddit bot authenticated as {me.name}")
+                "Bot Started",
+                f"Reddit bot authenticated as {self.identity.name}")
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             raise
 
-    def run(self, subreddit_name: str = None):
+        self.rate_limiter = RateLimiter(self.reddit, Config.RATE_LIMITS)
+        self.posted = PostedCommentIndex()
+        indexed = self.posted.rebuild(
+            self.reddit.redditor(self.identity.name), self.rate_limiter)
+        self._reconcile_intents(indexed)
+        self.duplicate_verifier = DuplicateVerifier(self.reddit, self.identity,
+                                                    self.posted,
+                                                    self.rate_limiter,
+                                                    self.notifier)
+        self.subreddit_settings: Dict[str, SubredditSettings] = {}
+        self.work_queue = SubmissionWorkQueue(Config.WORK_QUEUE_SIZE,
+                                              Config.WORK_QUEUE_ORDER)
+        self.comment_queue = queue.Queue()
+        # Related news is looked up from discovery onwards, alongside extraction
+        self.related_prefetch = ThreadPoolExecutor(
+            max_workers=Config.PROCESSING_WORKERS,
+            thread_name_prefix="related-prefetch")
+        self._related_futures: OrderedDict = OrderedDict()
+        self._related_lock = threading.Lock()
+        self._workers = []
+        self._poster: Optional[threading.Thread] = None
+
+    def run(self, subreddit_names: Optional[list] = None):
         """Main bot loop."""
-        if subreddit_name is None:
-            subreddit_name = Config.SUBREDDIT_NAME
+        subreddit = self.watch_subreddits(subreddit_names)
+        subreddit_name = str(subreddit)
 
         logger.info("Starting bot")
         self.notifier.send_notification(
             "Bot Active",
-            f"Monitoring r/{subreddit_name} for new submissions (max age: {Config.MAX_POST_AGE_MINUTES} minutes)"
+            f"Monitoring r/{subreddit_name} for new submissions (max age: {self._describe_age_limits()})"
         )
 
-        subreddit = self.reddit.subreddit(subreddit_name)
+        self.intake = SubmissionIntake(subreddit, Config.INTAKE_CURSOR_FILE)
         logger.info(
-            f"Rate limits: {Config.COMMENT_DELAY}s between comments, {Config.SUBMISSION_DELAY}s between checks"
+            f"Rate limits: {Config.RATE_LIMITS}, {Config.INTAKE_MIN_DELAY}-{Config.INTAKE_MAX_DELAY}s between checks"
         )
         logger.info(
-            f"Only processing posts less than {Config.MAX_POST_AGE_MINUTES} minutes old"
+            f"Only processing posts less than {self._describe_age_limits()} old"
         )
 
         last_monitoring_ping = time.time()
+        self._start_workers()
 
-        while True:
-            try:
-                processed_any = self._process_new_submissions(subreddit)
+        try:
+            while True:
+                try:
+                    queued_any = self._process_new_submissions(self.intake)
 
-                # Send monitoring ping if no new posts were processed and it's been a while
-                if not processed_any:
-                    current_time = time.time()
-                    if current_time - last_monitoring_ping >= Config.MONITORING_PING_DELAY:
-                        self._send_monitoring_ping(subreddit_name)
-                        last_monitoring_ping = current_time
+                    # Send monitoring ping if no new posts were queued and it's been a while
+                    if not queued_any:
+                        current_time = time.time()
+                        if current_time - last_monitoring_ping >= Config.MONITORING_PING_DELAY:
+                            self._send_monitoring_ping(subreddit_name)
+                            last_monitoring_ping = current_time
+
+                    logger.debug(
+                        f"Waiting {self.intake.delay} seconds before next submission check"
+                    )
+                    time.sleep(self.intake.delay)
+                except Exception as e:
+                    logger.error(f"Error in main loop: {e}")
+                    self.identity.refresh_on_auth_error(e)
+                    time.sleep(60)
+        finally:
+            self.close()
+
+    def watch_subreddits(self, subreddit_names: Optional[list] = None):
+        """Set up per-subreddit settings and return the combined listing.
+
+        All subreddits are read through one a+b+c listing, so they share one
+        Reddit session, rate-limit budget and worker pool.
+        """
+        subreddit_names = subreddit_names or Config.SUBREDDITS
+        overrides = {
+            name.lower(): settings
+            for name, settings in Config.SUBREDDIT_SETTINGS.items()
+        }
+        self.subreddit_settings = {
+            name.lower(): SubredditSettings(name, overrides.get(name.lower()))
+            for name in subreddit_names
+        }
+        return self.reddit.subreddit('+'.join(subreddit_names))
+
+    def _settings_for(self, submission) -> SubredditSettings:
+        """Settings of the subreddit a submission was posted in."""
+        try:
+            name = submission.subreddit.display_name
+        except Exception:
+            name = ''
+        settings = self.subreddit_settings.get(name.lower())
+        return settings or SubredditSettings(name)
+
+    def _get_deadline(self, submission) -> float:
+        """Time after which a submission is too old to summarize."""
+        max_age = self._settings_for(submission).max_post_age_minutes
+        return submission.created_utc + max_age * 60
+
+    def _describe_age_limits(self) -> str:
+        limits = sorted({
+            settings.max_post_age_minutes
+            for settings in self.subreddit_settings.values()
+        }) or [Config.MAX_POST_AGE_MINUTES]
+        return '/'.join(str(limit) for limit in limits) + " minutes"
+
+    def close(self):
+        """Stop the workers and release extraction resources."""
+        logger.info("Shutting down bot")
+        self.work_queue.close()
+        self.comment_queue.put(None)
+        self.pipeline.close()
+        self.related_prefetch.shutdown(wait=False, cancel_futures=True)
+        self.related_news.close()
+        self.duplicate_verifier.close()
+
+        # The comment poster writes to the history database; wait for it
+        # before closing. If still busy it is a daemon and dies with the
+        # process.
+        if self._poster:
+            self._poster.join(Config.SHUTDOWN_JOIN_TIMEOUT)
+            if self._poster.is_alive():
+                logger.warning("Comment poster still running; leaving history open")
+                return
+        self.history.close()
+
+    def _start_workers(self):
+        """Start the summarization workers and the comment poster."""
+        for i in range(Config.PROCESSING_WORKERS):
+            worker = threading.Thread(target=self._processing_worker,
+                                      name=f"processor-{i}",
+                                      daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+        poster = threading.Thread(target=self._comment_worker,
+                                  name="comment-poster",
+                                  daemon=True)
+        poster.start()
+        self._workers.append(poster)
+        self._poster = poster
+        logger.info(
+            f"Started {Config.PROCESSING_WORKERS} {Config.PROCESSING_WORKER_MODE} processing workers"
+        )
 
+    def _process_new_submissions(self, intake: SubmissionIntake) -> bool:
+        """Queue new submissions from the subreddit for the workers."""
+        queued_any = False
+        for submission in self._find_new_submissions(intake):
+            if self.work_queue.put(submission, self._get_deadline(submission)):
                 logger.info(
-                    f"Waiting {Config.SUBMISSION_DELAY} seconds before next submission check"
+                    f"Queued submission {submission.id} ({len(self.work_queue)} waiting)"
                 )
-                time.sleep(Config.SUBMISSION_DELAY)
+                queued_any = True
+        return queued_any
+
+    def _processing_worker(self):
+        """Summarize queued submissions and hand them to the comment poster."""
+        while True:
+            submission = self.work_queue.get()
+            if submission is None:
+                return
+            try:
+                self._process_submission(submission)
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                time.sleep(60)
+                logger.error(f"Error processing submission {submission.id}: {e}")
+                self.work_queue.done(submission.id)
+
+    def _comment_worker(self):
+        """Post comments one at a time as the comment rate limit allows."""
+        while True:
+            item = self.comment_queue.get()
+            if item is None:
+                return
+            submission, summary, related_news = item
+            try:
+                if self.history.has_commented(submission.id):
+                    continue
+                self._post_comment(submission, summary, related_news)
+            finally:
+                self.work_queue.done(submission.id)
 
-    def _process_new_submissions(self, subreddit):
-        """Process new submissions from the subreddit."""
-        processed_any = False
+    def _find_new_submissions(self, intake: SubmissionIntake) -> list:
+        """Return recent submissions that still need a summary."""
+        eligible = []
         try:
-            # Only check the 5 newest posts to reduce load
-            for submission in subreddit.new(limit=5):
-                # Check if post is too old (older than MAX_POST_AGE_MINUTES)
+            self.rate_limiter.acquire('fetch')
+            for submission in intake.poll():
+                # Check if post is too old (older than its subreddit's max age)
                 if not self._is_post_recent(submission):
                     logger.info(
-                        f"Skipping old post (>{Config.MAX_POST_AGE_MINUTES}min): {submission.title}"
+                        f"Skipping old post (>{self._settings_for(submission).max_post_age_minutes}min): {submission.title}"
                     )
                     continue
 
@@ -714,36 +3348,17 @@ class RedditBot:
                     continue
 
                 if self._should_process_submission(submission):
-                    self._process_submission(submission)
-                    processed_any = True
+                    eligible.append(submission)
+                    self._prefetch_related_news(submission)
 
         except Exception as e:
             logger.error(f"Error processing submissions: {e}")
 
-        return processed_any
+        return eligible
 
     def _has_bot_commented(self, submission) -> bool:
         """Check if the bot has already commented on the submission."""
-        try:
-            # Only check top-level comments and limit to first 20 to avoid hanging
-            submission.comments.replace_more(
-                limit=0)  # Don't expand "more comments"
-
-            bot_username = self.reddit.user.me().name
-
-            # Check only the first 20 top-level comments
-            for i, comment in enumerate(submission.comments):
-                if i >= 20:  # Limit to prevent hanging
-                    break
-
-                if hasattr(
-                        comment, 'author'
-                ) and comment.author and comment.author.name == bot_username:
-                    return True
-            return False
-        except Exception as e:
-            logger.error(f"Error checking comments: {e}")
-            return False
+        return self.posted.has_commented(submission.id)
 
     def _should_process_submission(self, submission) -> bool:
         """Determine if submission should be processed."""
@@ -755,52 +3370,122 @@ class RedditBot:
             logger.info(f"Skipping NSFW content: {submission.title}")
             return False
 
-        excluded_domains = ['reddit.com', 'i.redd.it', 'v.redd.it']
-        if any(domain in submission.url for domain in excluded_domains):
-            logger.info(f"Skipping excluded domain: {submission.url}")
+        reason = self._settings_for(submission).domain_policy.check(
+            submission.url)
+        if reason:
+            logger.info(f"Skipping {reason} link: {submission.url}")
             return False
 
         return True
 
     def _process_submission(self, submission):
-        """Process a single submission."""
+        """Summarize a submission and queue its comment for posting."""
+        summary = self._summarize_submission(submission)
+        if not summary:
+            self._discard_related_news(submission.id)
+            self.work_queue.done(submission.id)
+            return
+
+        # Related news is collected by _post_comment from the prefetch
+        self.comment_queue.put((submission, summary, None))
+
+    def _prefetch_related_news(self, submission):
+        """Start the related news lookup for a newly discovered submission."""
+        with self._related_lock:
+            if submission.id in self._related_futures:
+                return
+            self._related_futures[submission.id] = self.related_prefetch.submit(
+                self._fetch_related_africa_news, submission.title,
+                submission.url)
+            # Submissions dropped from the work queue never collect theirs
+            while len(self._related_futures) > 2 * Config.WORK_QUEUE_SIZE:
+                _, stale = self._related_futures.popitem(last=False)
+                stale.cancel()
+
+    def _collect_related_news(self, submission) -> list:
+        """Return the prefetched related news, fetching it now if needed."""
+        with self._related_lock:
+            future = self._related_futures.pop(submission.id, None)
+        if future is None or future.cancelled():
+            return self._fetch_related_africa_news(submission.title,
+                                                   submission.url)
+        return future.result()
+
+    def _discard_related_news(self, submission_id: str):
+        """Forget the prefetch for a submission that won't be commented on."""
+        with self._related_lock:
+            future = self._related_futures.pop(submission_id, None)
+        if future:
+            future.cancel()
+
+    def _summarize_submission(self, submission) -> Optional[str]:
+        """Extract and summarize a submission's article."""
         try:
             logger.info(
                 f"Processing: '{submission.title}' (ID: {submission.id})")
 
-            extracted = self.extractor.extract_content(submission.url)
-            if not extracted:
-                logger.warning(
-                    f"Content extraction failed for {submission.url}")
-                return
-
-            content = extracted['content']
-            word_count = extracted['word_count']
+            sentence_count = self._settings_for(submission).sentences_count
+            return self.pipeline.summarize(submission.url, sentence_count)
 
-            logger.info(f"Extracted {word_count} words from content")
+        except Exception as e:
+            logger.error(f"Error processing submission {submission.id}: {e}",
+                         exc_info=True)
+            return None
 
-            if word_count < Config.MIN_CONTENT_LENGTH:
-                logger.warning(
-                    f"Content too short ({word_count} words), skipping")
-                return
+    def _reconcile_intents(self, indexed: bool):
+        """Resolve replies whose outcome was unknown when we last stopped.
 
-            summary = self.summarizer.generate_summary(content)
-            if not summary:
-                logger.warning("Summary generation failed")
-                return
+        Needs a successful scan of our own comments: without one, a reply
+        that did land would look missing, so intents are left open (those
+        submissions are skipped) rather than cleared.
+        """
+        intents = self.history.pending_intents()
+        if not intents:
+            return
+
+        for _ in range(Config.INTENT_RESCAN_ATTEMPTS):
+            if indexed:
+                break
+            time.sleep(Config.INTENT_RESCAN_DELAY)
+            indexed = self.posted.rebuild(
+                self.reddit.redditor(self.identity.name), self.rate_limiter)
+        if not indexed:
+            logger.warning(
+                f"Could not scan posted comments; leaving {len(intents)} reply intents open"
+            )
+            return
 
-            self._post_comment(submission, summary)
+        for submission_id, content_hash, created_at in intents:
+            entries = self.posted.comments_for(submission_id)
+            if not entries:
+                logger.info(
+                    f"Reply to {submission_id} ({content_hash[:8]}) never landed; clearing intent"
+                )
+                self.history.clear_intent(submission_id)
+                continue
 
-        except Exception as e:
-            logger.error(f"Error processing submission {submission.id}: {e}",
-                         exc_info=True)
+            if any(
+                    self.posted.body_hashes.get(comment_id) == content_hash
+                    for comment_id, _ in entries):
+                logger.info(
+                    f"Reply to {submission_id} ({content_hash[:8]}) did land; marking commented"
+                )
+            else:
+                # Still ours (it carries the footer), just not this text
+                logger.warning(
+                    f"Another summary of ours is on {submission_id}, not the pending reply ({content_hash[:8]}); marking commented"
+                )
+            self.history.mark_commented(submission_id)
 
-    def _post_comment(self, submission, summary: str):
-        """Post comment with summary."""
+    def _post_comment(self,
+                      submission,
+                      summary: str,
+                      related_news: Optional[list] = None) -> bool:
+        """Post comment with summary. Returns True if it was posted."""
         try:
-            # Fetch related Africa news links
-            related_news = self._fetch_related_africa_news(
-                submission.title, submission.url)
+            # Collect the related Africa news links prefetched at discovery
+            if related_news is None:
+                related_news = self._collect_related_news(submission)
 
             # Construct the comment with the new format
             comment_text = f"""---
@@ -821,183 +3506,51 @@ class RedditBot:
 
 🤖 This response was automated!"""
 
-            new_comment = submission.reply(comment_text)
+            # An open intent means an earlier reply may have landed
+            if self.posted.has_commented(
+                    submission.id) or self.history.has_pending_intent(
+                        submission.id):
+                logger.info(
+                    f"Reply to {submission.id} already exists or is unresolved, skipping"
+                )
+                return False
+
+            # Write ahead so a crash between reply and bookkeeping is recoverable
+            content_hash = self.history.record_intent(submission.id,
+                                                      comment_text)
+            new_comment = self.rate_limiter.call('comment', submission.reply,
+                                                 comment_text)
             logger.info(
                 f"Comment posted successfully on submission {submission.id}")
+            self.posted.record(submission.id,
+                               new_comment.id,
+                               content_hash=content_hash)
+            self.history.mark_commented(submission.id)
 
             # Schedule duplicate removal
             self._schedule_duplicate_cleanup(submission)
 
-            self.history.mark_commented(submission.id)
-
             self.notifier.send_notification(
                 "Comment Posted", f"Posted summary on: {submission.title}",
                 f"https://reddit.com{submission.permalink}")
-
-            logger.info(
-                f"Waiting {Config.COMMENT_DELAY} seconds before next comment")
-            time.sleep(Config.COMMENT_DELAY)
+            return True
 
         except Exception as e:
             logger.error(
                 f"Failed to post comment on submission {submission.id}: {e}")
+            # Reddit rejected the reply outright, so nothing was created.
+            # Anything else (timeouts, 5xx) stays unresolved until restart.
+            rejected = isinstance(
+                e, (praw.exceptions.RedditAPIException,
+                    prawcore.exceptions.ResponseException)) and not isinstance(
+                        e, prawcore.exceptions.ServerError)
+            if rejected:
+                self.history.clear_intent(submission.id)
+            return False
 
     def _schedule_duplicate_cleanup(self, submission):
-        """Schedule aggressive duplicate comment cleanup with frequent checks."""
-        import threading
-
-        # More frequent cleanup rounds for aggressive duplicate detection
-        cleanup_rounds = [30, 60, 120, 300, 600, 1200]  # 30s, 1min, 2min, 5min, 10min, 20min
-
-        def run_cleanup_round(delay, round_num):
-            try:
-                time.sleep(delay)
-                logger.info(f"ðŸ§¹ Running aggressive duplicate cleanup round {round_num} for submission {submission.id}")
-                self._remove_duplicate_comments(submission)
-            except Exception as e:
-                logger.error(f"Error in cleanup round {round_num}: {e}")
-
-        # Schedule multiple cleanup rounds
-        for i, delay in enumerate(cleanup_rounds, 1):
-            cleanup_thread = threading.Thread(
-                target=run_cleanup_round, 
-                args=(delay, i), 
-                daemon=True
-            )
-            cleanup_thread.start()
-
-        logger.info(f"Scheduled {len(cleanup_rounds)} aggressive cleanup rounds for submission {submission.id}")
-
-    def _remove_duplicate_comments(self, submission):
-        """Enhanced duplicate comment removal with aggressive detection."""
-        try:
-            logger.info(f"Checking for duplicate comments on submission {submission.id}")
-
-            bot_username = self.reddit.user.me().name
-            max_attempts = 5
-            bot_comments = []
-            
-            # Multiple aggressive attempts to find all bot comments
-            for attempt in range(max_attempts):
-                try:
-                    # Force fresh data each time
-                    submission._fetched = False
-                    submission.comment_limit = None
-                    submission.comment_sort = "new"
-                    
-                    # Get all comments, including nested ones
-                    submission.comments.replace_more(limit=None)
-                    all_comments = submission.comments.list()
-                    
-                    current_bot_comments = []
-                    
-                    for comment in all_comments:
-                        try:
-                            # Very thorough bot comment detection
-                            if (hasattr(comment, 'author') and 
-                                comment.author is not None and 
-                                str(comment.author).lower() == bot_username.lower() and
-                                hasattr(comment, 'body') and
-                                ('âœ¦ Summary:' in comment.body or 'ðŸ¤– This response was automated!' in comment.body)):
-                                
-                                # Additional check to ensure it's not deleted
-                                try:
-                                    _ = comment.id  # This will fail if comment is deleted
-                                    _ = comment.created_utc  # This will fail if comment is inaccessible
-                                    current_bot_comments.append(comment)
-                                    logger.debug(f"Found bot comment {comment.id} created at {comment.created_utc}")
-                                except:
-                                    logger.debug(f"Skipping inaccessible comment")
-                                    continue
-                                    
-                        except Exception as e:
-                            logger.debug(f"Error checking comment: {e}")
-                            continue
-                    
-                    logger.info(f"Attempt {attempt + 1}: Found {len(current_bot_comments)} bot comments")
-                    
-                    # Keep the attempt that found the most comments
-                    if len(current_bot_comments) > len(bot_comments):
-                        bot_comments = current_bot_comments
-                    
-                    # If we found multiple comments, proceed with deletion
-                    if len(current_bot_comments) > 1:
-                        break
-                        
-                    # Wait between attempts
-                    if attempt < max_attempts - 1:
-                        time.sleep(3)
-                        
-                except Exception as e:
-                    logger.error(f"Attempt {attempt + 1} failed: {e}")
-                    time.sleep(2)
-                    continue
-
-            if len(bot_comments) <= 1:
-                logger.info(f"No duplicates found on submission {submission.id} (found {len(bot_comments)} bot comments)")
-                return
-
-            logger.warning(f"DUPLICATE DETECTED: Found {len(bot_comments)} bot comments on submission {submission.id}")
-
-            # Sort by creation time (keep oldest, remove newer ones)
-            try:
-                bot_comments.sort(key=lambda c: c.created_utc)
-                comment_to_keep = bot_comments[0]
-                duplicates_to_remove = bot_comments[1:]
-                
-                logger.info(f"Keeping comment {comment_to_keep.id}, removing {len(duplicates_to_remove)} duplicates")
-                
-            except Exception as e:
-                logger.error(f"Error sorting comments: {e}")
-                return
-
-            # Aggressively remove duplicates
-            removed_count = 0
-            for i, duplicate in enumerate(duplicates_to_remove):
-                try:
-                    # Try multiple deletion attempts for each duplicate
-                    for deletion_attempt in range(3):
-                        try:
-                            # Refresh the comment to ensure it still exists
-                            duplicate.refresh()
-                            
-                            # Check if it's already deleted
-                            if hasattr(duplicate, 'body') and duplicate.body == '[deleted]':
-                                logger.info(f"Comment {duplicate.id} already deleted")
-                                removed_count += 1
-                                break
-                            
-                            # Attempt deletion
-                            duplicate.delete()
-                            logger.info(f"Successfully deleted duplicate comment {duplicate.id}")
-                            removed_count += 1
-                            break
-                            
-                        except Exception as delete_error:
-                            logger.warning(f"Deletion attempt {deletion_attempt + 1} failed for comment {duplicate.id}: {delete_error}")
-                            if deletion_attempt < 2:
-                                time.sleep(2)
-                            continue
-                    
-                    # Rate limiting between deletions
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process duplicate comment {getattr(duplicate, 'id', 'unknown')}: {e}")
-
-            if removed_count > 0:
-                logger.info(f"SUCCESS: Removed {removed_count} duplicate comments from submission {submission.id}")
-                self.notifier.send_notification(
-                    "Duplicates Removed",
-                    f"Removed {removed_count} duplicate comments from: {submission.title}",
-                    f"https://reddit.com{submission.permalink}")
-            else:
-                logger.warning(f"FAILED: No duplicates were actually removed from submission {submission.id}")
-
-        except Exception as e:
-            logger.error(f"Critical error in duplicate comment removal: {e}", exc_info=True)
-
-    
+        """Queue duplicate checks for a freshly commented submission."""
+        self.duplicate_verifier.schedule(submission)
 
     def _fetch_related_africa_news(self, query: str, original_url: str = None):
         """
@@ -1013,34 +3566,7 @@ class RedditBot:
                 f"Africa {key_terms}"
             ]
 
-            all_news_items = []
-
-            for search_query in search_queries:
-                base_url = f"https://news.google.com/rss/search?q={requests.utils.quote(search_query)}&hl=en-ZA&gl=ZA&ceid=ZA:en"
-
-                try:
-                    response = requests.get(base_url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'xml')
-
-                    for item in soup.find_all(
-                            'item')[:10]:  # Get more items for filtering
-                        title = item.title.text if item.title else ""
-                        link = item.link.text if item.link else ""
-                        pub_date = item.pubDate.text if item.pubDate else ""
-
-                        if title and link:
-                            all_news_items.append({
-                                "title": title,
-                                "link": link,
-                                "pub_date": pub_date,
-                                "search_query": search_query
-                            })
-
-                except Exception as e:
-                    logger.debug(
-                        f"Error with search query '{search_query}': {e}")
-                    continue
+            all_news_items = self.related_news.search(search_queries)
 
             # Filter for relevance and remove duplicates
             filtered_news = self._filter_relevant_news(all_news_items, query,
@@ -1255,7 +3781,8 @@ class RedditBot:
     def _is_post_recent(self, submission) -> bool:
         """Check if post is recent enough to process."""
         post_age_minutes = self._get_post_age_minutes(submission)
-        return post_age_minutes <= Config.MAX_POST_AGE_MINUTES
+        max_age = self._settings_for(submission).max_post_age_minutes
+        return post_age_minutes <= max_age
 
     def _get_post_age_minutes(self, submission) -> float:
         """Get the age of a post in minutes."""
@@ -1276,6 +3803,7 @@ class RedditBot:
             logger.info(
                 f"ðŸ“¡ Monitoring ping sent at {current_time} - No new posts to process"
             )
+            logger.info(f"Rate limit budget: {self.rate_limiter.budget()}")
 
             # Send lightweight Discord notification every few pings to avoid spam
             if hasattr(self, '_ping_count'):
@@ -1293,6 +3821,186 @@ class RedditBot:
             logger.error(f"Error sending monitoring ping: {e}")
 
 
+class AsyncBotRunner:
+    """Runs RedditBot as independent asyncio tasks connected by queues.
+
+    Polling, extraction/summarization, related-news lookup and comment
+    posting each run as their own tasks, so the poller keeps going while a
+    comment waits for its slot. The comment rate limit is enforced by the
+    comment scheduler task alone. PRAW and the extractors are synchronous,
+    so their calls run in worker threads via asyncio.to_thread and the bot
+    keeps a single authenticated Reddit session.
+    """
+
+    def __init__(self, bot: RedditBot, subreddit_names: Optional[list] = None):
+        self.bot = bot
+        self.subreddit = bot.watch_subreddits(subreddit_names)
+        self.subreddit_name = str(self.subreddit)
+        # Same urgency ordering as the threaded SubmissionWorkQueue
+        self.discovered: asyncio.PriorityQueue = asyncio.PriorityQueue(
+            Config.ASYNC_QUEUE_SIZE)
+        self._sequence = itertools.count()
+        self.summarized: asyncio.Queue = asyncio.Queue(Config.ASYNC_QUEUE_SIZE)
+        self.ready: asyncio.Queue = asyncio.Queue(Config.ASYNC_QUEUE_SIZE)
+        # Submissions somewhere in the pipeline, so re-polls don't requeue them
+        self._in_flight: Set[str] = set()
+
+    async def run(self):
+        """Start every pipeline task and run until cancelled."""
+        logger.info("Starting bot (async runner)")
+        await asyncio.to_thread(
+            self.bot.notifier.send_notification, "Bot Active",
+            f"Monitoring r/{self.subreddit_name} for new submissions (max age: {self.bot._describe_age_limits()})"
+        )
+
+        tasks = [asyncio.create_task(self._poll_loop(), name="poller")]
+        tasks += [
+            asyncio.create_task(self._process_worker(), name=f"processor-{i}")
+            for i in range(Config.ASYNC_PROCESS_WORKERS)
+        ]
+        tasks.append(
+            asyncio.create_task(self._related_news_worker(),
+                                name="related-news"))
+        tasks.append(
+            asyncio.create_task(self._comment_scheduler(),
+                                name="comment-scheduler"))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.to_thread(self.bot.close)
+
+    async def _poll_loop(self):
+        """Discover new submissions and hand them to the processors."""
+        intake = SubmissionIntake(self.subreddit, Config.INTAKE_CURSOR_FILE)
+        last_monitoring_ping = time.time()
+
+        while True:
+            try:
+                submissions = await asyncio.to_thread(
+                    self.bot._find_new_submissions, intake)
+                queued = 0
+                for submission in submissions:
+                    if submission.id in self._in_flight:
+                        continue
+                    self._in_flight.add(submission.id)
+                    if Config.WORK_QUEUE_ORDER == "newest":
+                        priority = -submission.created_utc
+                    else:
+                        priority = self.bot._get_deadline(submission)
+                    await self.discovered.put(
+                        (priority, next(self._sequence), submission))
+                    queued += 1
+
+                if not queued and not self._in_flight:
+                    current_time = time.time()
+                    if current_time - last_monitoring_ping >= Config.MONITORING_PING_DELAY:
+                        await asyncio.to_thread(self.bot._send_monitoring_ping,
+                                                self.subreddit_name)
+                        last_monitoring_ping = current_time
+
+                await asyncio.sleep(intake.delay)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in poll loop: {e}")
+                await asyncio.to_thread(self.bot.identity.refresh_on_auth_error,
+                                        e)
+                await asyncio.sleep(60)
+
+    async def _process_worker(self):
+        """Extract and summarize discovered submissions."""
+        while True:
+            _, _, submission = await self.discovered.get()
+            try:
+                summary = await asyncio.to_thread(
+                    self.bot._summarize_submission, submission)
+                if summary:
+                    await self.summarized.put((submission, summary))
+                else:
+                    self.bot._discard_related_news(submission.id)
+                    self._in_flight.discard(submission.id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error summarizing {submission.id}: {e}")
+                self.bot._discard_related_news(submission.id)
+                self._in_flight.discard(submission.id)
+            finally:
+                self.discovered.task_done()
+
+    async def _related_news_worker(self):
+        """Collect the related news prefetched for summarized submissions."""
+        while True:
+            submission, summary = await self.summarized.get()
+            try:
+                related_news = await asyncio.to_thread(
+                    self.bot._collect_related_news, submission)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching related news: {e}")
+                related_news = []
+            finally:
+                self.summarized.task_done()
+            await self.ready.put((submission, summary, related_news))
+
+    async def _comment_scheduler(self):
+        """Post ready comments as fast as the comment rate limit allows."""
+        while True:
+            submission, summary, related_news = await self.ready.get()
+            try:
+                wait = self.bot.rate_limiter.wait_time('comment')
+                if wait > 0:
+                    logger.info(
+                        f"Comment on {submission.id} scheduled in {wait:.0f} seconds"
+                    )
+                    await asyncio.sleep(wait)
+
+                if self.bot.history.has_commented(submission.id):
+                    continue
+
+                await asyncio.to_thread(self.bot._post_comment, submission,
+                                        summary, related_news)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error posting comment on {submission.id}: {e}")
+            finally:
+                self._in_flight.discard(submission.id)
+                self.ready.task_done()
+
+
 if __name__ == "__main__":
-    bot = RedditBot()
-    bot.run()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reddit news summary bot")
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="report how long each dependency takes to import, then exit")
+    parser.add_argument(
+        "--subreddit",
+        dest="subreddits",
+        action="append",
+        help="subreddit to monitor; repeat to watch several (default: subreddits.py)")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="run polling, summarizing and commenting as concurrent tasks")
+    args = parser.parse_args()
+
+    if args.import_profile:
+        report_import_profile()
+    elif args.use_async:
+        bot = RedditBot()
+        try:
+            asyncio.run(AsyncBotRunner(bot, args.subreddits).run())
+        except KeyboardInterrupt:
+            logger.info("Bot stopped")
+    else:
+        bot = RedditBot()
+        bot.run(args.subreddits)
\ No newline at end of file
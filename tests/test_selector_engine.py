@@ -0,0 +1,170 @@
+"""SelectorEngine must match the BeautifulSoup/html.parser extractor it replaced.
+
+legacy_extract below is the old ContentExtractor._extract_with_advanced_selectors
+(BeautifulSoup with html.parser, soup.select per selector, then the <p>
+fallback). Outputs are compared after whitespace collapsing, which is what
+ContentExtractor._process_extracted_content does to either result.
+"""
+import os
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+import app
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures',
+                           'selector_corpus')
+GENERATED_PAGES = 1000
+GENERATED_SEED = 20261017
+
+
+def legacy_extract(html: str) -> str:
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in app.SelectorEngine.SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            content = ' '.join(
+                elem.get_text(separator=' ').strip() for elem in elements)
+            if len(content.split()) >= 30:
+                return content
+
+    paragraphs = soup.find_all('p')
+    return ' '.join(p.get_text(separator=' ').strip() for p in paragraphs)
+
+
+def engine_extract(html: str) -> str:
+    etree = app.lazy_import('lxml.etree')
+    tree = etree.fromstring(html.encode('utf-8'),
+                            etree.HTMLParser(encoding='utf-8'))
+    return app.SelectorEngine().extract(tree, mode="priority")
+
+
+def collapse(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def fixture_pages():
+    return sorted(name for name in os.listdir(FIXTURE_DIR)
+                  if name.endswith('.html'))
+
+
+@pytest.mark.parametrize('name', fixture_pages())
+def test_fixture_pages_match_legacy(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        html = f.read()
+    assert collapse(engine_extract(html)) == collapse(legacy_extract(html))
+
+
+WORDS = ("the government announced new policy on trade with neighbours "
+         "lagos nairobi accra &amp; café — “quoted” &nbsp; elections "
+         "farmers").split()
+ATTRIBUTES = [
+    '', ' class="content"', ' class="x article-content y"', ' id="content"',
+    ' role="main"', ' data-component="text-block"', ' class="story-body"',
+    ' class="entry-content"', ' class="post-content"', ' href="/x"'
+]
+BLOCK_TAGS = ['p', 'div', 'article', 'section', 'main', 'ul', 'a', 'b', 'em',
+              'span']
+INLINE_TAGS = ['a', 'b', 'em', 'span']
+LEAF_TAGS = ['script', 'style', 'comment', 'br', 'img']
+
+
+def random_text(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 25)))
+
+
+def random_content(rng: random.Random, depth: int = 0,
+                   inline: bool = False, in_link: bool = False) -> str:
+    """Random markup with valid nesting: no blocks inside inline elements or
+    <p>, and no <a> inside <a>."""
+    parts = []
+    for _ in range(rng.randint(1, 5)):
+        tag = rng.choice(BLOCK_TAGS + LEAF_TAGS)
+        if tag == 'comment':
+            parts.append(f'<!-- {random_text(rng)} -->')
+        elif tag in ('br', 'img'):
+            parts.append(f'<{tag}>')
+        elif tag == 'script':
+            parts.append(f'<script>var s = "{random_text(rng)}";</script>')
+        elif tag == 'style':
+            parts.append('<style>.a { color: red }</style>')
+        else:
+            if inline:
+                tag = rng.choice(INLINE_TAGS)
+            if in_link and tag == 'a':
+                tag = 'span'
+            attributes = rng.choice(ATTRIBUTES)
+            if tag == 'ul':
+                items = ''.join(f'<li>{random_text(rng)}</li>'
+                                for _ in range(3))
+                parts.append(f'<ul{attributes}>{items}</ul>')
+            elif tag == 'p' or depth > 3:
+                inner = random_text(rng)
+                if rng.random() < 0.3 and not in_link:
+                    inner += f' <a href="#">{random_text(rng)}</a> '
+                if rng.random() < 0.3:
+                    inner += f' <b>{random_text(rng)}</b>'
+                wrapper = 'p' if tag == 'p' and not inline else 'span'
+                parts.append(f'<{wrapper}{attributes}>{inner}</{wrapper}>')
+            else:
+                children = random_content(rng, depth + 1,
+                                          tag in INLINE_TAGS,
+                                          in_link or tag == 'a')
+                parts.append(f'<{tag}{attributes}>{random_text(rng)} '
+                             f'{children} </{tag}>')
+        parts.append(rng.choice(['', '\n', '  ', ' ' + random_text(rng)]))
+    return ''.join(parts)
+
+
+def test_generated_corpus_matches_legacy():
+    rng = random.Random(GENERATED_SEED)
+    mismatches = []
+    for i in range(GENERATED_PAGES):
+        html = ('<!DOCTYPE html><html><head><meta charset="utf-8">'
+                '<title>T</title></head><body>\n' + random_content(rng) +
+                '\n</body></html>')
+        if collapse(engine_extract(html)) != collapse(legacy_extract(html)):
+            mismatches.append(i)
+    assert not mismatches, f"generated pages {mismatches[:10]} differ"
+
+
+# Markup where libxml2 builds a different tree than html.parser did. These
+# are the known divergences; each case pins the new output and checks the
+# old one really differs, so the list stays accurate.
+KNOWN_DIVERGENCES = [
+    # libxml2 drops CDATA sections in HTML; html.parser kept their text.
+    ('<div class="content">' + 'word ' * 30 +
+     '<![CDATA[cdata text]]></div>', 'word ' * 30),
+    # A block inside an inline element closes the inline element first, so
+    # the trailing block is no longer part of the match.
+    ('<b class="content">' + 'word ' * 30 + '<p>para</p>tail</b>',
+     'word ' * 30),
+    # A nested <a> closes the open <a> the same way.
+    ('<div><a class="content" href="/a">' + 'word ' * 30 +
+     '<a href="/b">inner</a> tail</a></div>', 'word ' * 30),
+    # An unclosed <p> is closed by the next <p>; html.parser nested them
+    # and so repeated the inner paragraph's text in the fallback.
+    ('<div><p>one<p>two</div>', 'one two'),
+    # <div> inside <p> closes the <p>.
+    ('<p>one<div>two</div>three</p>', 'one'),
+]
+
+
+@pytest.mark.parametrize('html,expected', KNOWN_DIVERGENCES)
+def test_known_divergences(html, expected):
+    assert collapse(engine_extract(html)) == collapse(expected)
+    assert collapse(legacy_extract(html)) != collapse(expected)
+
+
+def test_density_mode_prefers_text_over_links():
+    links = ' '.join(f'<a href="/{i}">link number {i}</a>' for i in range(30))
+    article = 'plain article text ' * 20
+    html = (f'<div class="content">{links}</div>'
+            f'<div class="story-body">{article}</div>')
+    etree = app.lazy_import('lxml.etree')
+    tree = etree.fromstring(html.encode('utf-8'),
+                            etree.HTMLParser(encoding='utf-8'))
+    engine = app.SelectorEngine()
+    assert collapse(engine.extract(tree, mode="density")) == collapse(article)
+    assert 'link number' in engine.extract(tree, mode="priority")